@@ -12,6 +12,7 @@
 	let suggestions = []
 	let activeIndex = -1
 	let debounceTimer = null
+	let draftTimer = null
 	let resultsPollInterval = null
 	let requestPollInterval = null
 	let currentRequest = null  // Stores current request (type, data)
@@ -346,6 +347,25 @@
 		updateGhostText()
 		clearTimeout(debounceTimer)
 		debounceTimer = setTimeout(() => fetchSuggestions(text), 150)
+		// Send clarification edits so the agent can re-parse before confirmation
+		clearTimeout(draftTimer)
+		if (currentRequest && currentRequest.type === 'clarification') {
+			const sendDraft = () => {
+				fetch(`${API_BASE}/clarification-draft`, {
+					method: 'POST',
+					headers: { 'Content-Type': 'application/json' },
+					body: JSON.stringify({ text })
+				}).catch(() => {
+					// Ignore errors
+				})
+			}
+			// Send again if the text is still unchanged; the agent only re-parses
+			// a draft once two consecutive drafts agree
+			draftTimer = setTimeout(() => {
+				sendDraft()
+				draftTimer = setTimeout(sendDraft, 600)
+			}, 300)
+		}
 	})
 
 	q.addEventListener('keydown', (e) => {
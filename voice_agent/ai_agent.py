@@ -1,14 +1,71 @@
 """AI agent for parsing voice commands into structured intents."""
 
+import re
+import copy
 import json
+import difflib
 import hashlib
+import threading
 import openai
+from concurrent.futures import Future
 from typing import Dict, List, Optional, Union, Any
-from .config import LLM_ENDPOINT, LLM_MODEL, LLM_CACHE_ENABLED
+from .config import (
+    LLM_ENDPOINT, LLM_MODEL, LLM_CACHE_ENABLED,
+    LLM_SPECULATIVE_MODEL, LLM_NUM_SPECULATIVE_TOKENS, LLM_JSON_SCHEMA_ENABLED,
+    LLM_MAX_INSTALLED_APPS
+)
 from .hardcoded_commands import get_hardcoded_command
 from .pattern_matcher import PatternMatcher
 from .cache import get_cache_manager
 
+# Trailing sentence punctuation ignored in LLM cache keys (STT adds it inconsistently:
+# "Focus Chrome." vs "focus chrome"); symbols inside words such as "notepad++" are kept
+_CACHE_KEY_TRAILING_PUNCTUATION = ".!?,"
+
+# Leading words that mark a command as a question (answered as 'query' without the LLM)
+_QUESTION_STARTS = ("what", "which", "when", "where", "why", "who", "how")
+
+
+# JSON schema for parse_intent responses, used for grammar-guided decoding
+INTENT_JSON_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "commands": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "type": {
+                        "type": "string",
+                        "enum": [
+                            "list_apps", "focus_app", "place_app", "switch_tab", "open_url",
+                            "close_app", "close_tab", "activate_preset", "list_tabs",
+                            "list_recent_files", "list_projects", "query"
+                        ]
+                    },
+                    "app_name": {"type": "string"},
+                    "file_path": {"type": "string"},
+                    "file_name": {"type": "string"},
+                    "project_path": {"type": "string"},
+                    "project_name": {"type": "string"},
+                    "monitor": {"type": "string"},
+                    "maximize": {"type": "boolean"},
+                    "bounds": {"type": "array", "items": {"type": "integer"}, "minItems": 4, "maxItems": 4},
+                    "tab_index": {"type": "integer"},
+                    "tab_indices": {"type": "array", "items": {"type": "integer"}},
+                    "preset_name": {"type": "string"},
+                    "url": {"type": "string"},
+                    "question": {"type": "string"}
+                },
+                "required": ["type"]
+            }
+        },
+        "needs_clarification": {"type": "boolean"},
+        "clarification_reason": {"type": ["string", "null"]}
+    },
+    "required": ["commands", "needs_clarification", "clarification_reason"]
+}
+
 
 class AIAgent:
     """AI agent that uses OpenAI-compatible API to parse user commands."""
@@ -27,12 +84,41 @@ class AIAgent:
         # Fall back to global cache manager if not provided (for testing/mocking support)
         self.cache_manager = cache_manager if cache_manager is not None else get_cache_manager()
         self.pattern_matcher = PatternMatcher()
+        # LLM response cache statistics (see get_llm_cache_stats)
+        self.llm_cache_hits = 0
+        self.llm_cache_misses = 0
+        # LLM parses currently in flight, so identical concurrent requests share one call
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
         
         # Initialize OpenAI client with custom endpoint
         self.client = openai.OpenAI(
             base_url=self.endpoint,
             api_key="not-needed"  # Local endpoints don't require real API keys
         )
+        
+        # Server-specific request fields for intent parsing (e.g., speculative decoding draft model)
+        self.intent_extra_body: Dict[str, Any] = {}
+        if LLM_SPECULATIVE_MODEL:
+            self.intent_extra_body["speculative_model"] = LLM_SPECULATIVE_MODEL
+            self.intent_extra_body["num_speculative_tokens"] = LLM_NUM_SPECULATIVE_TOKENS
+        
+        # Constrain output to the intent schema so the server only samples valid intent JSON
+        if LLM_JSON_SCHEMA_ENABLED:
+            self.intent_response_format: Dict[str, Any] = {
+                "type": "json_schema",
+                "json_schema": {"name": "intent", "schema": INTENT_JSON_SCHEMA}
+            }
+        else:
+            self.intent_response_format = {"type": "json_object"}
+        
+        # Snapshotter for callers that don't pass one, created on first use and kept
+        # so its snapshot and formatted-text caches carry over between calls
+        self._state_snapshotter: Optional[Any] = None
+        
+        # Cleared once the server rejects response_format/extra_body, so later
+        # intent calls go straight to the plain request instead of failing first
+        self.intent_json_mode_supported = True
     
     def parse_intent(
         self, 
@@ -45,7 +131,8 @@ class AIAgent:
         recent_files: Optional[List[Dict]] = None,
         active_projects: Optional[List[Dict]] = None,
         current_project: Optional[Dict] = None,
-        state_snapshotter: Optional[Any] = None
+        state_snapshotter: Optional[Any] = None,
+        use_cache: bool = True
     ) -> Dict[str, Union[List[Dict], bool, Optional[str]]]:
         """
         Parse user command text into structured intents (supports single or multiple commands).
@@ -56,6 +143,9 @@ class AIAgent:
             installed_apps: Optional list of installed applications
             chrome_tabs: Optional list of Chrome tabs with 'index', 'title', 'url', 'domain', 'content_summary' keys
             available_presets: Optional list of available preset names
+            use_cache: Read and write the LLM response cache. Speculative parses of partial
+                text pass False; the caller stores the intent with cache_intent once the
+                final text is known
             
         Returns:
             Dictionary with 'commands' array (list of intent dicts), 'needs_clarification', and 'clarification_reason'
@@ -83,23 +173,87 @@ class AIAgent:
             return pattern_result
         
         # Simple question detection (handle as 'query' without LLM when clear)
-        question_starts = ("what", "which", "when", "where", "why", "who", "how")
-        if normalized_text.endswith("?") or normalized_text.startswith(question_starts):
+        if normalized_text.endswith("?") or normalized_text.startswith(_QUESTION_STARTS):
             return {
                 "commands": [{"type": "query", "question": text.strip()}],
                 "needs_clarification": False,
                 "clarification_reason": None,
             }
         
-        # Tier 3: Fall back to LLM with text-only cache (slow, ~500-2000ms, only when needed)
+        # Tier 3: Fall back to LLM. Identical requests already in flight (same text and
+        # same context objects, e.g. a repeated command in one queued batch) share one call
+        inflight_key = (
+            self._cache_key_text(normalized_text),
+            id(running_apps), id(installed_apps), id(chrome_tabs), id(available_presets),
+            id(recent_files), id(active_projects), id(current_project)
+        )
+        with self._inflight_lock:
+            future = self._inflight.get(inflight_key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[inflight_key] = future
+        if not owner:
+            # Callers may modify their intent, so each gets its own copy
+            result = copy.deepcopy(future.result())
+            if use_cache:
+                # The shared call may have been a speculative one that skipped the cache
+                self.cache_intent(text, result)
+            return result
+        
+        try:
+            result = self._parse_intent_llm(
+                text, normalized_text, running_apps, installed_apps, chrome_tabs, chrome_tabs_raw,
+                available_presets, recent_files, active_projects, current_project, state_snapshotter,
+                use_cache
+            )
+            future.set_result(copy.deepcopy(result))
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[inflight_key]
+    
+    def _parse_intent_llm(
+        self,
+        text: str,
+        normalized_text: str,
+        running_apps: List[str],
+        installed_apps: Optional[List[str]],
+        chrome_tabs: Optional[List[Dict[str, Union[str, int]]]],
+        chrome_tabs_raw: Optional[str],
+        available_presets: Optional[List[str]],
+        recent_files: Optional[List[Dict]],
+        active_projects: Optional[List[Dict]],
+        current_project: Optional[Dict],
+        state_snapshotter: Optional[Any],
+        use_cache: bool
+    ) -> Dict[str, Union[List[Dict], bool, Optional[str]]]:
+        """
+        Parse command text with the LLM (using the text-only response cache).
+        
+        Args:
+            text: User's command text
+            normalized_text: Lowercased, stripped command text
+            (remaining arguments as in parse_intent)
+            
+        Returns:
+            Intent dictionary as returned by parse_intent
+        """
+        # Check the text-only cache before the LLM call (slow, ~500-2000ms)
         # Generate text-only cache key (normalized text hash)
         text_hash = None
-        if LLM_CACHE_ENABLED and self.cache_manager:
-            text_hash = hashlib.md5(normalized_text.encode()).hexdigest()
+        if use_cache and LLM_CACHE_ENABLED and self.cache_manager:
+            text_hash = self._llm_cache_key(normalized_text)
             
             # Check text-only cache first using llm.responses namespace
             cached_result = self.cache_manager.get_llm(text_hash)
-            if cached_result is not None:
+            if cached_result is None:
+                self.llm_cache_misses += 1
+            else:
+                self.llm_cache_hits += 1
                 # Validate context after cache hit
                 validated_result = self._validate_context(
                     cached_result,
@@ -125,25 +279,33 @@ class AIAgent:
         
         try:
             # Try with response_format first (for models that support JSON mode)
-            try:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a helpful assistant that parses commands into structured JSON. Always return valid JSON only."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    temperature=0.1,  # Low temperature for consistent parsing
-                    response_format={"type": "json_object"}  # Request JSON response
-                )
-            except Exception as format_error:
-                # Fallback if response_format is not supported
-                print(f"Note: JSON mode not supported, using fallback: {format_error}")
+            response = None
+            if self.intent_json_mode_supported:
+                try:
+                    response = self.client.chat.completions.create(
+                        model=self.model,
+                        messages=[
+                            {
+                                "role": "system",
+                                "content": "You are a helpful assistant that parses commands into structured JSON. Always return valid JSON only."
+                            },
+                            {
+                                "role": "user",
+                                "content": prompt
+                            }
+                        ],
+                        temperature=0.1,  # Low temperature for consistent parsing
+                        response_format=self.intent_response_format,  # Request schema-constrained JSON
+                        extra_body=self.intent_extra_body or None
+                    )
+                except Exception as format_error:
+                    # Fallback if response_format (or extra server fields) are not supported
+                    print(f"Note: JSON mode not supported, using fallback: {format_error}")
+                    if isinstance(format_error, (openai.BadRequestError, openai.UnprocessableEntityError)):
+                        # The server rejected the request shape; don't send these fields again
+                        self.intent_json_mode_supported = False
+            
+            if response is None:
                 response = self.client.chat.completions.create(
                     model=self.model,
                     messages=[
@@ -195,8 +357,9 @@ class AIAgent:
                 
                 result["commands"] = commands
                 
-                # Cache the result with text-only key (if caching is enabled)
-                if text_hash and self.cache_manager:
+                # Cache the result with text-only key (if caching is enabled); ambiguous
+                # commands are not cached, so the user's clarification isn't asked for forever
+                if text_hash and self.cache_manager and not result["needs_clarification"]:
                     # Cache with no TTL (text-only key means context changes don't invalidate)
                     self.cache_manager.set_llm(text_hash, result, ttl=0)
                 
@@ -212,6 +375,153 @@ class AIAgent:
             traceback.print_exc()
             return {"commands": [{"type": "list_apps"}], "needs_clarification": False, "clarification_reason": None}
     
+    def cache_intent(self, text: str, intent: Dict[str, Any]) -> None:
+        """
+        Store an intent in the LLM response cache for its final command text.
+        
+        Used for intents parsed speculatively (with use_cache=False) once the
+        final text turns out to match. Ambiguous intents, and text the hardcoded
+        commands or question detection already answer without the LLM, are skipped.
+        
+        Args:
+            text: Final command text the intent was parsed from
+            intent: Intent dictionary as returned by parse_intent
+        """
+        if not (LLM_CACHE_ENABLED and self.cache_manager) or intent.get("needs_clarification"):
+            return
+        normalized_text = text.lower().strip()
+        if get_hardcoded_command(normalized_text) is not None:
+            return
+        if normalized_text.endswith("?") or normalized_text.startswith(_QUESTION_STARTS):
+            return
+        # The caller goes on to use (and may modify) its intent, so the cache keeps a copy
+        self.cache_manager.set_llm(self._llm_cache_key(normalized_text), copy.deepcopy(intent), ttl=0)
+    
+    def _llm_cache_key(self, normalized_text: str) -> str:
+        """Hash normalized command text into its LLM response cache key."""
+        return hashlib.md5(self._cache_key_text(normalized_text).encode()).hexdigest()
+    
+    @staticmethod
+    def _cache_key_text(normalized_text: str) -> str:
+        """
+        Reduce command text to the form used for LLM cache keys.
+        
+        Trailing sentence punctuation and repeated whitespace are dropped, so
+        near-verbatim repeats of a command share one cached response.
+        """
+        return " ".join(normalized_text.rstrip().rstrip(_CACHE_KEY_TRAILING_PUNCTUATION).split())
+    
+    def get_llm_cache_stats(self) -> Dict[str, int]:
+        """
+        Get LLM response cache statistics.
+        
+        Returns:
+            Dict with 'hits' and 'misses' counts since startup
+        """
+        return {"hits": self.llm_cache_hits, "misses": self.llm_cache_misses}
+    
+    def _get_state_snapshotter(self) -> Any:
+        """
+        Get the agent's own StateSnapshotter, creating it on first use.
+        
+        Returns:
+            StateSnapshotter instance
+        """
+        if self._state_snapshotter is None:
+            from .monitoring import StateSnapshotter
+            self._state_snapshotter = StateSnapshotter()
+        return self._state_snapshotter
+    
+    def warmup_connection(self):
+        """
+        Open a keep-alive connection to the LLM endpoint with a lightweight models request,
+        so the first intent request reuses it instead of paying for the TCP/TLS handshake.
+        """
+        try:
+            self.client.models.list()
+        except Exception:
+            pass  # Endpoint may not implement /models; parse_intent reports real errors
+    
+    def warmup(self, installed_apps: Optional[List[str]] = None):
+        """
+        Send a throwaway intent request so the first real command doesn't pay for
+        model loading, prompt prefix caching and JSON schema compilation on the server.
+        The response is discarded and nothing is cached.
+        
+        Args:
+            installed_apps: Optional list of installed applications (matches the real prompt prefix)
+        """
+        try:
+            prompt = self._build_optimized_prompt(
+                "focus finder", [], installed_apps, None, None, None, None, None, None, None
+            )
+            self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are a helpful assistant that parses commands into structured JSON. Always return valid JSON only."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                temperature=0.1,
+                max_tokens=1,
+                response_format=self.intent_response_format if self.intent_json_mode_supported else openai.NOT_GIVEN,
+                extra_body=(self.intent_extra_body or None) if self.intent_json_mode_supported else None
+            )
+        except (openai.BadRequestError, openai.UnprocessableEntityError):
+            # Same rejection parse_intent would hit; skip the failing first attempt there
+            self.intent_json_mode_supported = False
+        except Exception:
+            pass  # Warmup is best-effort; parse_intent reports real errors
+    
+    def _select_prompt_apps(
+        self,
+        normalized_text: str,
+        running_apps: List[str],
+        installed_apps: List[str]
+    ) -> List[str]:
+        """
+        Pick the installed apps worth listing in the prompt, capped at LLM_MAX_INSTALLED_APPS.
+        
+        Apps whose name matches a word of the command come first (prefix or close fuzzy
+        match), then installed apps that are running, then the rest in list order.
+        
+        Args:
+            normalized_text: Normalized user command
+            running_apps: List of currently running applications
+            installed_apps: List of installed applications
+            
+        Returns:
+            List of installed app names to include in the prompt
+        """
+        if LLM_MAX_INSTALLED_APPS <= 0 or len(installed_apps) <= LLM_MAX_INSTALLED_APPS:
+            return installed_apps
+        
+        words = [w for w in re.findall(r"[a-z0-9]+", normalized_text) if len(w) >= 3]
+        
+        def matches_command(app: str) -> bool:
+            app_lower = app.lower()
+            if app_lower in normalized_text:
+                return True
+            for token in re.findall(r"[a-z0-9]+", app_lower):
+                for word in words:
+                    if token.startswith(word) or (len(token) >= 3 and word.startswith(token)):
+                        return True
+                    if difflib.SequenceMatcher(None, word, token).ratio() >= 0.8:
+                        return True
+            return False
+        
+        running_set = frozenset(running_apps or [])
+        mentioned = [app for app in installed_apps if matches_command(app)]
+        running = [app for app in installed_apps if app in running_set]
+        
+        selected = list(dict.fromkeys([*mentioned, *running, *installed_apps]))
+        return selected[:LLM_MAX_INSTALLED_APPS]
+    
     def _build_optimized_prompt(
         self,
         normalized_text: str,
@@ -267,7 +577,13 @@ class AIAgent:
             context_parts.append("Running applications: None")
         
         if installed_apps:
-            context_parts.append(f"Installed applications ({len(installed_apps)} total): {', '.join(installed_apps)}")
+            prompt_apps = self._select_prompt_apps(normalized_text, running_apps, installed_apps)
+            if len(prompt_apps) < len(installed_apps):
+                context_parts.append(
+                    f"Installed applications ({len(prompt_apps)} most relevant of {len(installed_apps)}): {', '.join(prompt_apps)}"
+                )
+            else:
+                context_parts.append(f"Installed applications ({len(installed_apps)} total): {', '.join(installed_apps)}")
         
         # Recent queries (keep at 5)
         try:
@@ -349,10 +665,7 @@ class AIAgent:
         try:
             from .config import STATE_SNAPSHOT_ENABLED
             if STATE_SNAPSHOT_ENABLED:
-                snapshotter = state_snapshotter
-                if snapshotter is None:
-                    from .monitoring import StateSnapshotter
-                    snapshotter = StateSnapshotter()
+                snapshotter = state_snapshotter or self._get_state_snapshotter()
                 state_snapshot = snapshotter.format_snapshot_for_llm()
                 if state_snapshot:
                     context_parts.append("\n" + state_snapshot)
@@ -514,6 +827,7 @@ class AIAgent:
         # Make a copy to avoid modifying the cached result
         result = json.loads(json.dumps(cached_result))
         commands = result.get("commands", [])
+        known_apps = frozenset(running_apps).union(installed_apps)
         
         # Validate each command
         for cmd in commands:
@@ -524,7 +838,7 @@ class AIAgent:
                 app_name = cmd.get("app_name")
                 if app_name:
                     # Check if app name exists in current context
-                    if app_name not in running_apps and app_name not in installed_apps:
+                    if app_name not in known_apps:
                         # Try fuzzy matching to find current app name
                         matched_app = match_app_name(app_name, running_apps, installed_apps)
                         if matched_app:
@@ -726,11 +1040,10 @@ class AIAgent:
         
         # Include current state snapshot if available
         try:
-            from .monitoring import StateSnapshotter
             from .config import STATE_SNAPSHOT_ENABLED
             if STATE_SNAPSHOT_ENABLED:
-                # answer_query doesn't receive state_snapshotter parameter, create new instance
-                snapshotter = StateSnapshotter()
+                # answer_query doesn't receive state_snapshotter parameter, use the agent's own
+                snapshotter = self._get_state_snapshotter()
                 state_snapshot = snapshotter.format_snapshot_for_llm()
                 if state_snapshot:
                     context_parts.append("\n" + state_snapshot)
@@ -1,6 +1,6 @@
 """Lightweight local HTTP API for Electron client: /suggest and /submit."""
 
-from typing import Optional, Any, Dict, List
+from typing import Optional, Any, Callable, Dict, List
 import threading
 from flask import Flask, request, jsonify
 
@@ -28,6 +28,9 @@ _request_response: Optional[Dict[str, Any]] = None
 _request_lock = threading.Lock()
 _request_event = threading.Event()
 
+# Called with the edited text while a clarification is pending (for early re-parsing)
+_draft_listener: Optional[Callable[[str], None]] = None
+
 
 def _build_context(cache_manager) -> Dict[str, Any]:
 	"""Build context dict consistent with existing web dialog suggest route."""
@@ -158,6 +161,21 @@ def _create_app() -> Flask:
 		except Exception as e:
 			return jsonify({'status': 'error', 'message': str(e)}), 500
 
+	@app.route("/clarification-draft", methods=["POST", "OPTIONS"])
+	def clarification_draft():
+		"""Receive the in-progress text of a pending clarification (debounced by the client)."""
+		if request.method == "OPTIONS":
+			return ("", 204)
+		data = request.get_json(silent=True) or {}
+		text = str(data.get('text', '')).strip()
+		listener = _draft_listener
+		if text and listener is not None:
+			try:
+				listener(text)
+			except Exception:
+				pass
+		return jsonify({'status': 'ok'})
+
 	return app
 
 
@@ -260,3 +278,12 @@ def wait_for_response(timeout: Optional[float] = None) -> Optional[Dict[str, Any
 	return None
 
 
+def set_draft_listener(listener: Optional[Callable[[str], None]]) -> None:
+	"""
+	Set the callback for clarification draft text (None to stop listening).
+	
+	Args:
+		listener: Callable receiving the current draft text
+	"""
+	global _draft_listener
+	_draft_listener = listener
@@ -2,6 +2,8 @@
 
 import json
 import os
+import queue
+import threading
 import time
 from typing import Any, Dict, List, Optional
 
@@ -100,6 +102,11 @@ class CacheManager:
             "activity_history": []
         }
         
+        # Commands waiting to be appended to history by the background writer
+        self._history_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._history_writer: Optional[threading.Thread] = None
+        self._history_lock = threading.Lock()
+        
         # Load persistent data
         if self.enabled:
             self._load_persistent_data()
@@ -290,10 +297,119 @@ class CacheManager:
         if not self.enabled:
             return
         
+        with self._history_lock:
+            if self._record_history(command):
+                self._save_persistent_data()
+    
+    def add_to_history_async(self, command: str) -> None:
+        """
+        Add a command to history without waiting for the disk write.
+        
+        Commands are appended by a background writer thread, which saves
+        the history once per batch of pending commands.
+        
+        Args:
+            command: Command text to add
+        """
+        if not self.enabled:
+            return
+        
+        self._history_queue.put(command)
+        if self._history_writer is None:
+            # Commands are recorded from both the main and queue threads; start exactly one writer
+            with self._history_lock:
+                if self._history_writer is None:
+                    self._history_writer = threading.Thread(
+                        target=self._history_writer_loop, name="history-writer", daemon=True
+                    )
+                    self._history_writer.start()
+    
+    def flush_history(self, timeout: float = 2.0) -> None:
+        """
+        Write any commands still waiting for the background writer.
+        
+        Args:
+            timeout: Maximum seconds to wait for the writer to finish its current batch
+        """
+        writer = self._history_writer
+        if writer is not None and writer.is_alive():
+            # The writer may already hold a dequeued command it hasn't recorded yet; a
+            # marker queued behind it is only set once that batch has been saved
+            done = threading.Event()
+            self._history_queue.put(done)
+            done.wait(timeout)
+        
+        flushed: List[threading.Event] = []
+        with self._history_lock:
+            try:
+                if self._drain_history_queue(flushed):
+                    self._save_persistent_data()
+            except Exception as e:
+                print(f"Warning: Failed to save command history: {e}")
+        for event in flushed:
+            event.set()
+    
+    def _history_writer_loop(self) -> None:
+        """Append queued commands to history, saving once per batch."""
+        while True:
+            item = self._history_queue.get()
+            flushed: List[threading.Event] = []
+            # Keep the writer alive through save errors (e.g. unserializable activity
+            # details), so later commands are still persisted
+            try:
+                with self._history_lock:
+                    if isinstance(item, threading.Event):
+                        flushed.append(item)
+                        changed = False
+                    else:
+                        changed = self._record_history(item)
+                    if self._drain_history_queue(flushed) or changed:
+                        self._save_persistent_data()
+            except Exception as e:
+                print(f"Warning: Failed to save command history: {e}")
+            finally:
+                for event in flushed:
+                    event.set()
+    
+    def _drain_history_queue(self, flushed: List[threading.Event]) -> int:
+        """
+        Record all pending queued commands in memory.
+        
+        Args:
+            flushed: Receives flush markers found in the queue, to be set once saved
+        
+        Returns:
+            Number of commands that changed the history
+        """
+        count = 0
+        while True:
+            try:
+                item = self._history_queue.get_nowait()
+            except queue.Empty:
+                return count
+            if isinstance(item, threading.Event):
+                flushed.append(item)
+            elif self._record_history(item):
+                count += 1
+    
+    def _record_history(self, command: str) -> bool:
+        """
+        Move a command to the front of the in-memory history.
+        
+        Args:
+            command: Command text to add
+            
+        Returns:
+            False if the command already was the most recent entry (nothing to save)
+        """
         history = self._persistent_data.get("command_history", []) or []
         if not isinstance(history, list):
             history = []
         
+        # Repeating the last command leaves the history unchanged
+        if history and history[0] == command:
+            return False
+        
         # Remove if already exists (move to front)
         if command in history:
             history.remove(command)
@@ -306,7 +422,7 @@ class CacheManager:
             history = history[:self.history_size]
         
         self._persistent_data["command_history"] = history
-        self._save_persistent_data()
+        return True
     
     def get_history(self) -> List[str]:
         """
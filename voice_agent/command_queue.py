@@ -20,10 +20,14 @@ class _CommandQueue:
 	def put_command(self, command_text: str) -> None:
 		if not isinstance(command_text, str):
 			return
-		text = command_text.strip()
-		if not text:
+		# Pasted multi-line input becomes one command per line, queued together so
+		# the queue worker drains (and parses) them as one batch
+		lines = [line.strip() for line in command_text.splitlines()]
+		lines = [line for line in lines if line]
+		if not lines:
 			return
-		self._queue.put(text)
+		for line in lines:
+			self._queue.put(line)
 
 	def try_get_command(self) -> Optional[str]:
 		try:
@@ -31,6 +35,14 @@ class _CommandQueue:
 		except Empty:
 			return None
 
+	def wait_for_commands(self, max_items: int = 100, timeout: Optional[float] = None) -> List[str]:
+		# Block until at least one command is queued, then take whatever else is pending
+		try:
+			first = self._queue.get(timeout=timeout)
+		except Empty:
+			return []
+		return [first] + self.drain_commands(max_items=max_items - 1)
+
 	def drain_commands(self, max_items: int = 100) -> List[str]:
 		collected: List[str] = []
 		for _ in range(max_items):
@@ -56,3 +68,7 @@ def drain_commands(max_items: int = 100) -> List[str]:
 	return _shared_queue.drain_commands(max_items=max_items)
 
 
+def wait_for_commands(max_items: int = 100, timeout: Optional[float] = None) -> List[str]:
+	return _shared_queue.wait_for_commands(max_items=max_items, timeout=timeout)
+
+
@@ -1,6 +1,6 @@
 """Command to activate a preset window layout."""
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from .base import Command
 from ..window_control import place_app_on_monitor, list_running_apps
 from ..presets import get_preset, find_matching_presets, load_presets, list_presets
@@ -13,6 +13,10 @@ class ActivatePresetCommand(Command):
         """Check if this command can handle the intent type."""
         return intent_type == "activate_preset"
     
+    def invalidated_cache_entries(self) -> List[Tuple[str, Optional[str]]]:
+        """Presets may launch apps, changing the running apps list."""
+        return [("apps", "running")]
+    
     def execute(self, intent: Dict[str, Any]) -> bool:
         """Execute the activate preset command."""
         preset_name = intent.get("preset_name")
@@ -1,7 +1,7 @@
 """Base command class for voice agent commands."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 
 
 class Command(ABC):
@@ -45,3 +45,16 @@ class Command(ABC):
         """
         return False  # Default: action commands don't produce results
 
+    
+    def invalidated_cache_entries(self) -> List[Tuple[str, Optional[str]]]:
+        """
+        Return cache entries that executing this command makes stale.
+        
+        Commands that launch/close apps or change tabs return the affected
+        (namespace_path, key) pairs so the executor can drop them and the next
+        context fetch reflects the new state. A key of None means the whole namespace.
+        
+        Returns:
+            List of (namespace_path, key) tuples (empty by default)
+        """
+        return []
@@ -1,6 +1,6 @@
 """Command to close/quit an application."""
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from .base import Command
 from ..window_control import close_app
 
@@ -12,6 +12,10 @@ class CloseAppCommand(Command):
         """Check if this command can handle the intent type."""
         return intent_type == "close_app"
     
+    def invalidated_cache_entries(self) -> List[Tuple[str, Optional[str]]]:
+        """Closing an app changes the running apps list."""
+        return [("apps", "running")]
+    
     def execute(self, intent: Dict[str, Any]) -> bool:
         """Execute the close app command."""
         app_name = intent.get("app_name")
@@ -1,6 +1,6 @@
 """Command to close Chrome tabs."""
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from .base import Command
 from ..tab_control import close_chrome_tab
 
@@ -12,6 +12,10 @@ class CloseTabCommand(Command):
         """Check if this command can handle the intent type."""
         return intent_type == "close_tab"
     
+    def invalidated_cache_entries(self) -> List[Tuple[str, Optional[str]]]:
+        """Closing tabs changes the tab list."""
+        return [("browsers.chrome", "tabs"), ("browsers.chrome", "tabs_raw")]
+    
     def execute(self, intent: Dict[str, Any]) -> bool:
         """Execute the close tab command - AI has already selected the tabs."""
         tab_indices = intent.get("tab_indices")
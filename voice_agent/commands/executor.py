@@ -2,6 +2,7 @@
 
 from typing import Any, Dict, List
 from .base import Command
+from ..cache import get_cache_manager
 from .list_apps import ListAppsCommand
 from .list_tabs import ListTabsCommand
 from .list_recent_files import ListRecentFilesCommand
@@ -19,8 +20,15 @@ from .query import QueryCommand
 class CommandExecutor:
     """Executes commands based on parsed intents."""
     
-    def __init__(self):
-        """Initialize the command executor with available commands."""
+    def __init__(self, cache_manager=None):
+        """
+        Initialize the command executor with available commands.
+        
+        Args:
+            cache_manager: CacheManager instance for cache invalidation and history (optional)
+        """
+        # Fall back to global cache manager if not provided (for testing/mocking support)
+        self.cache_manager = cache_manager if cache_manager is not None else get_cache_manager()
         self.commands: List[Command] = [
             ListAppsCommand(),
             ListTabsCommand(),
@@ -86,6 +94,9 @@ class CommandExecutor:
                     if not success:
                         all_succeeded = False
                     
+                    # Drop cached context the command made stale (e.g., launched/closed apps)
+                    self._invalidate_stale_cache(command)
+                    
                     # If command doesn't produce results, signal "done" immediately
                     if not command.produces_results():
                         try:
@@ -103,6 +114,21 @@ class CommandExecutor:
         
         return all_succeeded
     
+    def _invalidate_stale_cache(self, command: Command) -> None:
+        """
+        Invalidate cache entries made stale by an executed command.
+        
+        Args:
+            command: The command that was just executed
+        """
+        entries = command.invalidated_cache_entries()
+        if not entries:
+            return
+        cache_manager = self.cache_manager
+        if cache_manager:
+            for namespace_path, key in entries:
+                cache_manager.invalidate(namespace_path, key)
+    
     def _normalize_to_commands_list(self, intent: Any) -> List[Dict[str, Any]]:
         """
         Normalize various intent formats to a list of command intents.
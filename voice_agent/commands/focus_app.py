@@ -1,6 +1,6 @@
 """Command to focus/activate an application."""
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from .base import Command
 from ..window_control import activate_app
 
@@ -12,6 +12,10 @@ class FocusAppCommand(Command):
         """Check if this command can handle the intent type."""
         return intent_type == "focus_app"
     
+    def invalidated_cache_entries(self) -> List[Tuple[str, Optional[str]]]:
+        """Focusing may launch the app, changing the running apps list."""
+        return [("apps", "running")]
+    
     def execute(self, intent: Dict[str, Any]) -> bool:
         """Execute the focus app command."""
         app_name = intent.get("app_name")
@@ -1,6 +1,6 @@
 """Command to open URLs in Chrome."""
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from .base import Command
 from ..tab_control import open_url_in_chrome
 
@@ -12,6 +12,10 @@ class OpenUrlCommand(Command):
         """Check if this command can handle the intent type."""
         return intent_type == "open_url"
     
+    def invalidated_cache_entries(self) -> List[Tuple[str, Optional[str]]]:
+        """Opening a URL adds a new tab."""
+        return [("browsers.chrome", "tabs"), ("browsers.chrome", "tabs_raw")]
+    
     def execute(self, intent: Dict[str, Any]) -> bool:
         """Execute the open URL command - creates a new tab."""
         url = intent.get("url")
@@ -1,6 +1,6 @@
 """Command to place an application on a specific monitor."""
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from .base import Command
 from ..window_control import place_app_on_monitor
 
@@ -12,6 +12,10 @@ class PlaceAppCommand(Command):
         """Check if this command can handle the intent type."""
         return intent_type == "place_app"
     
+    def invalidated_cache_entries(self) -> List[Tuple[str, Optional[str]]]:
+        """Placing may launch the app, changing the running apps list."""
+        return [("apps", "running")]
+    
     def execute(self, intent: Dict[str, Any]) -> bool:
         """Execute the place app command."""
         app_name = intent.get("app_name")
@@ -1,6 +1,6 @@
 """Command to switch Chrome tabs."""
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from .base import Command
 from ..tab_control import switch_to_chrome_tab
 
@@ -12,6 +12,10 @@ class SwitchTabCommand(Command):
         """Check if this command can handle the intent type."""
         return intent_type == "switch_tab"
     
+    def invalidated_cache_entries(self) -> List[Tuple[str, Optional[str]]]:
+        """Switching tabs changes which tab is active."""
+        return [("browsers.chrome", "tabs"), ("browsers.chrome", "tabs_raw")]
+    
     def execute(self, intent: Dict[str, Any]) -> bool:
         """Execute the switch tab command - AI has already selected the tab."""
         tab_index = intent.get("tab_index")
@@ -18,6 +18,19 @@ class Config:
         self.llm_endpoint = os.getenv("VOICE_AGENT_LLM_ENDPOINT", "http://localhost:8000/v1")
         self.llm_model = os.getenv("VOICE_AGENT_LLM_MODEL", "qwen-30b")
         
+        # Speculative decoding (optional): small draft model the LLM server uses to propose
+        # tokens for the target model. Only sent when the server supports it (e.g., vLLM).
+        self.llm_speculative_model = os.getenv("VOICE_AGENT_LLM_SPECULATIVE_MODEL", "")
+        self.llm_num_speculative_tokens = int(os.getenv("VOICE_AGENT_LLM_NUM_SPECULATIVE_TOKENS", "5"))
+        
+        # Constrain intent parsing output to the intent JSON schema (grammar-guided decoding).
+        # Falls back to plain JSON mode when disabled.
+        self.llm_json_schema_enabled = os.getenv("VOICE_AGENT_LLM_JSON_SCHEMA_ENABLED", "true").lower() == "true"
+        
+        # Maximum number of installed apps listed in the intent prompt (those matching the
+        # command and running apps first); 0 lists all of them
+        self.llm_max_installed_apps = int(os.getenv("VOICE_AGENT_LLM_MAX_INSTALLED_APPS", "50"))
+        
         # Speech-to-text engine: "macos", "whisper" (default), or "sphinx"
         # Default to Whisper for better accuracy and cross-platform support
         default_stt = os.getenv("VOICE_AGENT_STT_ENGINE", None)
@@ -48,6 +61,14 @@ class Config:
         # Silence duration threshold for automatic speech end detection (in seconds)
         self.silence_duration = float(os.getenv("VOICE_AGENT_SILENCE_DURATION", "0.75"))
         
+        # Recordings whose loudest 50ms window is below this level (in dB) are treated as
+        # silence and skip transcription entirely (e.g., accidental hotkey taps)
+        self.speech_gate_db = float(os.getenv("VOICE_AGENT_SPEECH_GATE_DB", "-46"))
+        
+        # Interval (in seconds) between partial transcriptions while the hotkey is held.
+        # Partials let intent parsing start before release; 0 disables them
+        self.stt_partial_interval = float(os.getenv("VOICE_AGENT_STT_PARTIAL_INTERVAL", "0"))
+        
         # Global hotkey for triggering voice commands (e.g., 'cmd+alt', 'cmd+shift+v')
         self.hotkey = os.getenv("VOICE_AGENT_HOTKEY", "cmd+alt")
         
@@ -66,6 +87,13 @@ class Config:
         self.autocomplete_enabled = os.getenv("VOICE_AGENT_AUTOCOMPLETE_ENABLED", "true").lower() == "true"
         self.autocomplete_max_suggestions = int(os.getenv("VOICE_AGENT_AUTOCOMPLETE_MAX_SUGGESTIONS", "5"))
         
+        # Logging level for status output (e.g., "INFO", "WARNING"); "DEBUG" adds per-stage timings
+        self.log_level = os.getenv("VOICE_AGENT_LOG_LEVEL", "INFO").upper()
+        
+        # Directory for per-command cProfile dumps (.prof files, e.g. for snakeviz); empty disables
+        profile_dir = os.getenv("VOICE_AGENT_PROFILE_DIR", "")
+        self.profile_dir = os.path.expanduser(profile_dir) if profile_dir else ""
+        
         # Local API (for external UI clients like Electron)
         self.api_port = int(os.getenv("VOICE_AGENT_API_PORT", "8770"))
         
@@ -162,9 +190,15 @@ _config = Config()
 # Expose configuration values as module-level variables
 LLM_ENDPOINT = _config.llm_endpoint
 LLM_MODEL = _config.llm_model
+LLM_SPECULATIVE_MODEL = _config.llm_speculative_model
+LLM_NUM_SPECULATIVE_TOKENS = _config.llm_num_speculative_tokens
+LLM_JSON_SCHEMA_ENABLED = _config.llm_json_schema_enabled
+LLM_MAX_INSTALLED_APPS = _config.llm_max_installed_apps
 STT_ENGINE = _config.stt_engine
 WHISPER_MODEL = _config.whisper_model
 SILENCE_DURATION = _config.silence_duration
+SPEECH_GATE_DB = _config.speech_gate_db
+STT_PARTIAL_INTERVAL = _config.stt_partial_interval
 HOTKEY = _config.hotkey
 TEXT_HOTKEY = _config.text_hotkey
 MONITORS = _config.monitors
@@ -177,6 +211,8 @@ CACHE_HISTORY_PATH = _config.cache_history_path
 AUTOCOMPLETE_ENABLED = _config.autocomplete_enabled
 AUTOCOMPLETE_MAX_SUGGESTIONS = _config.autocomplete_max_suggestions
 API_PORT = _config.api_port
+LOG_LEVEL = _config.log_level
+PROFILE_DIR = _config.profile_dir
 LLM_CACHE_ENABLED = _config.llm_cache_enabled
 CACHE_FILES_TTL = _config.cache_files_ttl
 FILE_CONTEXT_ENABLED = _config.file_context_enabled
@@ -197,9 +233,15 @@ __all__ = [
     "Config",
     "LLM_ENDPOINT",
     "LLM_MODEL",
+    "LLM_SPECULATIVE_MODEL",
+    "LLM_NUM_SPECULATIVE_TOKENS",
+    "LLM_JSON_SCHEMA_ENABLED",
+    "LLM_MAX_INSTALLED_APPS",
     "STT_ENGINE",
     "WHISPER_MODEL",
     "SILENCE_DURATION",
+    "SPEECH_GATE_DB",
+    "STT_PARTIAL_INTERVAL",
     "HOTKEY",
     "TEXT_HOTKEY",
     "MONITORS",
@@ -212,6 +254,8 @@ __all__ = [
     "AUTOCOMPLETE_ENABLED",
     "AUTOCOMPLETE_MAX_SUGGESTIONS",
     "API_PORT",
+    "LOG_LEVEL",
+    "PROFILE_DIR",
     "LLM_CACHE_ENABLED",
     "CACHE_FILES_TTL",
     "FILE_CONTEXT_ENABLED",
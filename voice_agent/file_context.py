@@ -4,7 +4,7 @@ import os
 import time
 import subprocess
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from .cache import get_cache_manager
 from .config import CACHE_FILES_TTL
@@ -369,6 +369,22 @@ class FileContextTracker:
         
         return None
     
+    def snapshot(self) -> Tuple[List[Dict], List[Dict], Optional[Dict]]:
+        """
+        Get recent files, active projects and the current project together.
+        
+        The project lookups reuse the recent files, so fetching them in this order runs
+        the Spotlight query once; fetched separately and concurrently, each lookup would
+        miss the cache and run its own query.
+        
+        Returns:
+            Tuple of (recent files, active projects, current project)
+        """
+        recent_files = self.get_recent_files()
+        active_projects = self.get_active_projects()
+        current_project = self.get_current_project()
+        return recent_files, active_projects, current_project
+    
     def find_file(self, file_name: str, current_project: Optional[Dict] = None) -> Optional[str]:
         """
         Find a file with fuzzy matching, prioritizing current project.
@@ -4,6 +4,31 @@ import difflib
 from typing import List, Optional
 
 
+def _fuzzy_ratio(matcher: difflib.SequenceMatcher, candidate: str, score_to_beat: float) -> float:
+    """
+    Compute the fuzzy similarity ratio, skipping candidates that cannot matter.
+    
+    real_quick_ratio() and quick_ratio() are cheap upper bounds of ratio(), so the full
+    comparison only runs when the candidate could pass the 0.3 threshold and its fuzzy
+    score (ratio * 40) could beat the best score so far. The bounds are symmetric and
+    reuse the matcher's cached counts for the input text; ratio() is not symmetric, so
+    the full comparison keeps the original (input text, candidate) order.
+    
+    Args:
+        matcher: SequenceMatcher with the input text set as the second sequence
+        candidate: Lowercased name to compare against
+        score_to_beat: Best score so far, minus any boost the candidate would get
+        
+    Returns:
+        Similarity ratio, or 0.0 if the candidate cannot pass or win
+    """
+    bound = max(0.3, score_to_beat / 40.0)
+    matcher.set_seq1(candidate)
+    if matcher.real_quick_ratio() <= bound or matcher.quick_ratio() <= bound:
+        return 0.0
+    return difflib.SequenceMatcher(None, matcher.b, candidate).ratio()
+
+
 def match_app_name(text: str, running_apps: List[str], installed_apps: List[str]) -> Optional[str]:
     """
     Match a text input to an app name using fuzzy matching.
@@ -25,16 +50,18 @@ def match_app_name(text: str, running_apps: List[str], installed_apps: List[str]
     
     # Combine running and installed apps (prioritize running)
     # Check running apps first
-    all_apps = list(set(running_apps + installed_apps))
+    running_set = frozenset(running_apps)
+    all_apps = list(running_set.union(installed_apps))
     
     best_match = None
     best_score = 0.0
     best_is_running = False
+    matcher = difflib.SequenceMatcher(None, b=text_lower)
     
     for app in all_apps:
         app_lower = app.lower()
         score = 0.0
-        is_running = app in running_apps
+        is_running = app in running_set
         
         # Exact match (highest priority)
         if app_lower == text_lower:
@@ -47,7 +74,7 @@ def match_app_name(text: str, running_apps: List[str], installed_apps: List[str]
             score = 50.0 + (len(text_lower) / len(app_lower)) * 10
         # Fuzzy match (lower priority)
         else:
-            ratio = difflib.SequenceMatcher(None, text_lower, app_lower).ratio()
+            ratio = _fuzzy_ratio(matcher, app_lower, best_score - (5.0 if is_running else 0.0))
             if ratio > 0.3:  # Threshold for fuzzy matching
                 score = ratio * 40.0
         
@@ -87,6 +114,7 @@ def match_preset_name(text: str, available_presets: List[str]) -> Optional[str]:
     
     best_match = None
     best_score = 0.0
+    matcher = difflib.SequenceMatcher(None, b=text_lower)
     
     for preset in available_presets:
         preset_lower = preset.lower()
@@ -103,7 +131,7 @@ def match_preset_name(text: str, available_presets: List[str]) -> Optional[str]:
             score = 50.0 + (len(text_lower) / len(preset_lower)) * 10
         # Fuzzy match
         else:
-            ratio = difflib.SequenceMatcher(None, text_lower, preset_lower).ratio()
+            ratio = _fuzzy_ratio(matcher, preset_lower, best_score)
             if ratio > 0.3:
                 score = ratio * 40.0
         
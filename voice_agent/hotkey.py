@@ -1,7 +1,7 @@
 """Global hotkey listener for triggering voice commands."""
 
 import threading
-from queue import Queue
+from queue import Queue, Empty
 from typing import Optional
 from pynput import keyboard
 
@@ -9,15 +9,18 @@ from pynput import keyboard
 class HotkeyListener:
     """Global hotkey listener that works from any application."""
     
-    def __init__(self, hotkey: Optional[str] = None):
+    def __init__(self, hotkey: Optional[str] = None, notify_event: Optional[threading.Event] = None):
         """
         Initialize hotkey listener.
         
         Args:
             hotkey: Hotkey combination (e.g., 'ctrl+alt' or 'cmd+shift+v')
                    Default: 'ctrl+alt'
+            notify_event: Optional event to set on hotkey press, so one waiter can
+                   block on several listeners at once
         """
         self.hotkey = hotkey or 'ctrl+alt'
+        self.notify_event = notify_event
         self.event_queue = Queue()
         self.listener = None
         self.running = False
@@ -29,6 +32,8 @@ class HotkeyListener:
         if not self.is_pressed:
             self.is_pressed = True
             self.event_queue.put('hotkey_pressed')
+            if self.notify_event is not None:
+                self.notify_event.set()
         return False  # Don't suppress the event
     
     def _on_hotkey_release(self):
@@ -71,31 +76,29 @@ class HotkeyListener:
                 # Track which modifiers are currently pressed
                 self.pressed_modifiers = set()
                 
+                # The callbacks run on every key event system-wide, so resolve the
+                # key-to-modifier mapping and the required set once up front
+                modifier_keys = {
+                    keyboard.Key.ctrl_l: 'ctrl', keyboard.Key.ctrl_r: 'ctrl',
+                    keyboard.Key.alt_l: 'alt', keyboard.Key.alt_r: 'alt',
+                    keyboard.Key.cmd_l: 'cmd', keyboard.Key.cmd_r: 'cmd',
+                    keyboard.Key.shift_l: 'shift', keyboard.Key.shift_r: 'shift',
+                }
+                modifier_names = {'ctrl': 'ctrl', 'control': 'ctrl', 'alt': 'alt', 'option': 'alt',
+                                  'cmd': 'cmd', 'shift': 'shift'}
+                required_modifiers = frozenset(
+                    modifier_names[part.strip()] for part in parts if part.strip() in modifier_names
+                )
+                
                 def on_press(key):
                     try:
                         # Track modifier keys
-                        if key == keyboard.Key.ctrl_l or key == keyboard.Key.ctrl_r:
-                            self.pressed_modifiers.add('ctrl')
-                        elif key == keyboard.Key.alt_l or key == keyboard.Key.alt_r:
-                            self.pressed_modifiers.add('alt')
-                        elif key == keyboard.Key.cmd_l or key == keyboard.Key.cmd_r:
-                            self.pressed_modifiers.add('cmd')
-                        elif key == keyboard.Key.shift_l or key == keyboard.Key.shift_r:
-                            self.pressed_modifiers.add('shift')
+                        modifier = modifier_keys.get(key)
+                        if modifier is None:
+                            return
+                        self.pressed_modifiers.add(modifier)
                         
                         # Check if all required modifiers are pressed
-                        required_modifiers = set()
-                        for part in parts:
-                            part = part.strip()
-                            if part in ['ctrl', 'control']:
-                                required_modifiers.add('ctrl')
-                            elif part in ['alt', 'option']:
-                                required_modifiers.add('alt')
-                            elif part == 'cmd':
-                                required_modifiers.add('cmd')
-                            elif part == 'shift':
-                                required_modifiers.add('shift')
-                        
                         if required_modifiers.issubset(self.pressed_modifiers):
                             self._on_hotkey_press()
                     except:
@@ -104,27 +107,10 @@ class HotkeyListener:
                 def on_release(key):
                     try:
                         # Remove modifier from set when released
-                        if key == keyboard.Key.ctrl_l or key == keyboard.Key.ctrl_r:
-                            self.pressed_modifiers.discard('ctrl')
-                        elif key == keyboard.Key.alt_l or key == keyboard.Key.alt_r:
-                            self.pressed_modifiers.discard('alt')
-                        elif key == keyboard.Key.cmd_l or key == keyboard.Key.cmd_r:
-                            self.pressed_modifiers.discard('cmd')
-                        elif key == keyboard.Key.shift_l or key == keyboard.Key.shift_r:
-                            self.pressed_modifiers.discard('shift')
-                        
-                        # Check if all required modifiers are still pressed
-                        required_modifiers = set()
-                        for part in parts:
-                            part = part.strip()
-                            if part in ['ctrl', 'control']:
-                                required_modifiers.add('ctrl')
-                            elif part in ['alt', 'option']:
-                                required_modifiers.add('alt')
-                            elif part == 'cmd':
-                                required_modifiers.add('cmd')
-                            elif part == 'shift':
-                                required_modifiers.add('shift')
+                        modifier = modifier_keys.get(key)
+                        if modifier is None:
+                            return
+                        self.pressed_modifiers.discard(modifier)
                         
                         # If modifiers are no longer all pressed, release hotkey
                         if not required_modifiers.issubset(self.pressed_modifiers):
@@ -188,6 +174,32 @@ class HotkeyListener:
         except:
             return False
     
+    def consume_press(self) -> bool:
+        """
+        Drain pending hotkey events without blocking.
+        
+        Returns:
+            True if a hotkey press was pending, False otherwise
+        """
+        pressed = False
+        while True:
+            try:
+                event = self.event_queue.get_nowait()
+            except Empty:
+                return pressed
+            if event == 'hotkey_pressed':
+                pressed = True
+    
+    def has_pending_press(self) -> bool:
+        """
+        Check for a pending hotkey press without consuming it.
+        
+        Returns:
+            True if a hotkey press is waiting to be consumed, False otherwise
+        """
+        with self.event_queue.mutex:
+            return 'hotkey_pressed' in self.event_queue.queue
+    
     def wait_for_hotkey_release(self, timeout: Optional[float] = None) -> bool:
         """
         Wait for hotkey release (after it's been pressed).
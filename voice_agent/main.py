@@ -1,57 +1,118 @@
 """Main entry point for the voice window agent."""
 
+import os
 import sys
 import time
-from typing import Optional, Tuple, Any
-from concurrent.futures import ThreadPoolExecutor
+import cProfile
+import contextlib
+import logging
+import threading
+from typing import TYPE_CHECKING, Optional, Tuple, Any, Dict
+from concurrent.futures import ThreadPoolExecutor, Future
 from .stt import transcribe_while_held
 from .stt.factory import set_cached_engine
-from .ai_agent import AIAgent
-from .monitoring import list_running_apps, list_chrome_tabs_with_content
+from .monitoring import (
+    list_running_apps, list_chrome_tabs, list_chrome_tabs_with_content, list_running_apps_and_chrome_tabs
+)
 from .window_control import list_installed_apps
 from .monitoring import ActivityMonitor, StateSnapshotter
-from .api_server import send_request, wait_for_response, trigger_palette
+from .api_server import (
+    send_request, wait_for_response, trigger_palette, set_draft_listener, start_api_server
+)
 from .commands import CommandExecutor
 from .config import (
     LLM_ENDPOINT, STT_ENGINE, HOTKEY, TEXT_HOTKEY, WHISPER_MODEL,
     CACHE_ENABLED, CACHE_HISTORY_SIZE, CACHE_HISTORY_PATH,
     AUTOCOMPLETE_ENABLED, AUTOCOMPLETE_MAX_SUGGESTIONS, LLM_CACHE_ENABLED,
     FILE_CONTEXT_ENABLED, SYSTEM_MONITOR_ENABLED, STATE_SNAPSHOT_ENABLED,
-    STATE_SNAPSHOT_INTERVAL
+    STATE_SNAPSHOT_INTERVAL, LOG_LEVEL, API_PORT, PROFILE_DIR
 )
 from .cache import initialize_cache_manager, get_cache_manager
 from .hotkey import HotkeyListener
+from .command_queue import wait_for_commands
 from .presets import load_presets, list_presets
 
+if TYPE_CHECKING:
+    # Imported on the startup pool instead (pulls in the OpenAI client)
+    from .ai_agent import AIAgent
+
+logger = logging.getLogger(__name__)
+
+# Background workers that refresh context while waiting for the next hotkey
+_prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="prefetch")
+
+# Maximum age (in seconds) of prefetched context that a hotkey press will still use;
+# older context is dropped and fetched fresh for that command
+_PREFETCH_MAX_AGE = 10.0
+
+# Workers for the per-command context fetches in gather_context_parallel (kept alive
+# across commands instead of spinning up threads on every hotkey press)
+_context_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="context")
+
+# Runs intent parsing on partial transcripts while the user is still speaking
+_speculative_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="speculative")
+
+# Parses the intents of a batch of queued API commands concurrently (at most one batch
+# of drain_commands at a time)
+_QUEUE_BATCH_SIZE = 10
+_intent_executor = ThreadPoolExecutor(max_workers=_QUEUE_BATCH_SIZE, thread_name_prefix="intent")
+
+# Commands that stop the agent
+_QUIT_COMMANDS = frozenset({"quit", "exit", "q"})
+
+# Status line shown whenever the agent goes back to idle
+_WAITING_MSG = f"👂 Waiting for hotkeys ({HOTKEY} for voice, {TEXT_HOTKEY} for text)..."
+
+
+class _DeferredFlushHandler(logging.StreamHandler):
+    """
+    Stream handler that doesn't flush after every record. The main loop flushes
+    stdout once per command (and before blocking for input), so a command's
+    status lines go out in one write instead of one write per line.
+    
+    Records are written synchronously so they stay in order with the print()
+    output from the STT engines and commands that share stdout.
+    """
+    
+    def flush(self):
+        pass
+
+
+_HELP_TEXT = "\n".join([
+    "=" * 60,
+    "Talker",
+    "=" * 60,
+    f"\n⌨️  Hotkeys:",
+    f"  - Voice mode: Press {HOTKEY} to activate (works from any window)",
+    f"  - Text mode: Press {TEXT_HOTKEY} to activate (works from any window)",
+    "\n🎤 Voice Commands / 📝 Text Commands:",
+    "  - 'Bring [App] to view' / 'Focus [App]' / 'Show [App]'",
+    "  - 'Put [App] on [main/right/left] monitor' / 'Move [App] to [main/right/left] screen'",
+    "  - 'Place [App] on [monitor] and maximize'",
+    "  - 'List apps' / 'What's running'",
+    "  - 'Switch to [Tab]' / 'Go to tab [Number]' / 'List tabs'",
+    "  - 'Close [App]' / 'Quit [App]'",
+    "  - 'Close tab [Number]' / 'Close [Tab Name]'",
+    "  - 'Activate [Preset]' / '[Preset]' / 'Set up [Preset]' (preset window layouts)",
+    "  - 'quit' or 'exit' to stop",
+    f"\nUsing LLM endpoint: {LLM_ENDPOINT}",
+    f"Using STT engine: {STT_ENGINE.upper()}",
+    "=" * 60,
+    f"\nVoice mode: Hold {HOTKEY} to speak, release to process command.",
+    f"Text mode: Press {TEXT_HOTKEY} to open text input dialog.\n",
+]) + "\n"
+
 
 def print_help():
     """Print welcome message and help text."""
-    print("=" * 60)
-    print("Talker")
-    print("=" * 60)
-    print(f"\n⌨️  Hotkeys:")
-    print(f"  - Voice mode: Press {HOTKEY} to activate (works from any window)")
-    print(f"  - Text mode: Press {TEXT_HOTKEY} to activate (works from any window)")
-    print("\n🎤 Voice Commands / 📝 Text Commands:")
-    print("  - 'Bring [App] to view' / 'Focus [App]' / 'Show [App]'")
-    print("  - 'Put [App] on [main/right/left] monitor' / 'Move [App] to [main/right/left] screen'")
-    print("  - 'Place [App] on [monitor] and maximize'")
-    print("  - 'List apps' / 'What's running'")
-    print("  - 'Switch to [Tab]' / 'Go to tab [Number]' / 'List tabs'")
-    print("  - 'Close [App]' / 'Quit [App]'")
-    print("  - 'Close tab [Number]' / 'Close [Tab Name]'")
-    print("  - 'Activate [Preset]' / '[Preset]' / 'Set up [Preset]' (preset window layouts)")
-    print("  - 'quit' or 'exit' to stop")
-    print(f"\nUsing LLM endpoint: {LLM_ENDPOINT}")
-    print(f"Using STT engine: {STT_ENGINE.upper()}")
-    print("=" * 60)
-    print(f"\nVoice mode: Hold {HOTKEY} to speak, release to process command.")
-    print(f"Text mode: Press {TEXT_HOTKEY} to open text input dialog.\n")
+    # Everything in the banner is fixed at import time, so it is built once and written in one call
+    sys.stdout.write(_HELP_TEXT)
+    sys.stdout.flush()
 
 
 def time_operation(operation_name: str, func, *args, **kwargs):
     """
-    Time an operation and print the duration.
+    Time an operation and log the duration (at DEBUG level).
     
     Args:
         operation_name: Name of the operation for display
@@ -61,17 +122,129 @@ def time_operation(operation_name: str, func, *args, **kwargs):
     Returns:
         Result of the function call
     """
-    start_time = time.time()
+    # Timings are debug output; skip the clock reads entirely when they won't be shown
+    if not logger.isEnabledFor(logging.DEBUG):
+        return func(*args, **kwargs)
+    start_ns = time.perf_counter_ns()
     result = func(*args, **kwargs)
-    elapsed = time.time() - start_time
-    print(f"⏱️  {operation_name} took: {elapsed:.2f}s")
+    elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
+    logger.debug("⏱️  %s took: %.1fms", operation_name, elapsed_ms)
     return result
 
 
+def run_profiled(func, *args, **kwargs):
+    """
+    Run a function, writing a cProfile dump for it if VOICE_AGENT_PROFILE_DIR is set.
+    
+    Only the calling thread is profiled; work on the context, prefetch and intent pools
+    shows up as time spent waiting on their futures.
+    
+    Args:
+        func: Function to run
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+        
+    Returns:
+        Result of func
+    """
+    if not PROFILE_DIR:
+        return func(*args, **kwargs)
+    
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profiler.disable()
+        try:
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            path = os.path.join(PROFILE_DIR, f"talker-{time.time_ns()}.prof")
+            profiler.dump_stats(path)
+            logger.debug("Profile written to %s", path)
+        except OSError as e:
+            logger.warning("Could not write profile: %s", e)
+
+
+def _normalize_command_text(text: str) -> str:
+    """Normalize command text for comparison (collapse whitespace, casefold)."""
+    return " ".join(text.split()).casefold()
+
+
+def create_agent(cache_manager=None) -> "AIAgent":
+    """
+    Import and create the AI agent.
+    
+    The import is done here rather than at module load so loading the OpenAI client
+    overlaps with the other startup work instead of delaying the banner.
+    
+    Args:
+        cache_manager: CacheManager instance for LLM response caching (optional)
+    """
+    from .ai_agent import AIAgent
+    return AIAgent(cache_manager=cache_manager)
+
+
+def _is_quit_command(text: str) -> bool:
+    """Check whether the text is one of the quit commands."""
+    # Length guard first: real commands are longer than any quit word, so they skip the casefold
+    stripped = text.strip()
+    return len(stripped) <= 4 and stripped.casefold() in _QUIT_COMMANDS
+
+
+def finish_whisper_startup(preload_future: Future, stream_future: Future):
+    """
+    Wait for the background Whisper startup and register the engine with the factory.
+    
+    Returns:
+        The initialized Whisper engine, or None if startup failed (the model is then
+        loaded on first use)
+    """
+    try:
+        preload_future.result()
+        whisper_engine = stream_future.result()
+        # Set the cached engine so factory uses the initialized instance
+        set_cached_engine(whisper_engine)
+        return whisper_engine
+    except Exception as e:
+        logger.warning("⚠️  Could not initialize Whisper: %s", e)
+        logger.info("   Model will be loaded on first use.")
+        return None
+
+
+def load_tab_contents(
+    text: str,
+    running_apps: Optional[list],
+    chrome_tabs: Optional[list],
+    chrome_tabs_raw: Optional[str]
+) -> Tuple[Optional[list], Optional[str], bool]:
+    """
+    Add content summaries to the Chrome tabs if the command mentions tabs.
+    
+    Reading tab contents runs JavaScript in every tab (and activates Chrome), so it
+    is skipped for commands that don't refer to tabs.
+    
+    Args:
+        text: Command text
+        running_apps: List of running apps
+        chrome_tabs: List of Chrome tabs from gather_context_parallel
+        chrome_tabs_raw: Raw AppleScript output for Chrome tabs
+        
+    Returns:
+        Tuple of (chrome_tabs, chrome_tabs_raw, loaded) where loaded is True if contents were read
+    """
+    if "tab" not in text.lower() or not running_apps or "Google Chrome" not in running_apps:
+        return chrome_tabs, chrome_tabs_raw, False
+    tab_list = (chrome_tabs, chrome_tabs_raw) if chrome_tabs is not None else None
+    chrome_tabs, chrome_tabs_raw = time_operation(
+        "Chrome Tab Contents", list_chrome_tabs_with_content, tab_list
+    )
+    return chrome_tabs, chrome_tabs_raw, True
+
+
 def handle_clarification(
     text: str,
     intent: dict,
-    agent: AIAgent,
+    agent: "AIAgent",
     running_apps: list,
     installed_apps: list,
     chrome_tabs: Optional[list],
@@ -100,24 +273,45 @@ def handle_clarification(
         return text, intent
     
     clarification_reason = intent.get("clarification_reason")
-    commands_count = len(intent.get("commands", []))
+    commands_count = len(intent.get("commands") or ())
     
-    print("⚠️  Command needs clarification...")
+    logger.info("⚠️  Command needs clarification...")
     if commands_count > 1:
-        print(f"   Detected {commands_count} commands")
+        logger.info("   Detected %d commands", commands_count)
     if clarification_reason:
-        print(f"   Reason: {clarification_reason}")
+        logger.info("   Reason: %s", clarification_reason)
+    
+    # Re-parse drafts while the user edits the text, so the corrected intent is
+    # usually ready by the time they confirm. The palette re-sends a draft that stays
+    # unchanged, so a draft is only parsed once the user has stopped typing; drafts
+    # bypass the LLM cache and only the confirmed text is stored
+    draft_intent = SpeculativeIntent(
+        lambda draft_text: agent.parse_intent(
+            draft_text, running_apps, installed_apps,
+            chrome_tabs=chrome_tabs, chrome_tabs_raw=chrome_tabs_raw,
+            available_presets=available_presets,
+            recent_files=recent_files, active_projects=active_projects,
+            current_project=current_project,
+            use_cache=False
+        ),
+        min_words=2
+    )
+    set_draft_listener(draft_intent.on_partial)
     
     # Send clarification request to Electron client
     trigger_palette()  # Ensure Electron window is visible
     send_request("clarification", {"text": text, "reason": clarification_reason})
     
     # Wait for user response
-    response = wait_for_response()
+    sys.stdout.flush()
+    try:
+        response = wait_for_response()
+    finally:
+        set_draft_listener(None)
     
     if response is None or response.get("cancelled", False):
         # User cancelled
-        print("   Clarification cancelled, skipping command.\n")
+        logger.info("   Clarification cancelled, skipping command.")
         return None, None
     
     confirmed_text = response.get("text", "").strip()
@@ -125,35 +319,64 @@ def handle_clarification(
     if not confirmed_text:
         confirmed_text = text
     
-    if confirmed_text != text:
+    if _normalize_command_text(confirmed_text) != _normalize_command_text(text):
         # User corrected the text, re-parse intent
-        print(f"   Corrected text: '{confirmed_text}'")
+        logger.info("   Corrected text: '%s'", confirmed_text)
         text = confirmed_text
-        
-        # Re-parse intent with corrected text
-        start_llm = time.time()
-        intent = agent.parse_intent(
-            text, running_apps, installed_apps, 
-            chrome_tabs=chrome_tabs, chrome_tabs_raw=chrome_tabs_raw, 
-            available_presets=available_presets,
-            recent_files=recent_files, active_projects=active_projects, 
-            current_project=current_project
+        chrome_tabs, chrome_tabs_raw, tab_contents_loaded = load_tab_contents(
+            text, running_apps, chrome_tabs, chrome_tabs_raw
         )
-        llm_time = time.time() - start_llm
-        print(f"⏱️  LLM (Re-parsing) took: {llm_time:.2f}s\n")
+        
+        # Use the draft parse if the user confirmed the last draft (and no tab contents
+        # were loaded since), otherwise re-parse intent with corrected text
+        intent = None
+        if not tab_contents_loaded:
+            intent = time_operation("LLM (Draft Re-parse)", draft_intent.result_for, text)
+            if intent is not None:
+                agent.cache_intent(text, intent)
+        if intent is None:
+            intent = time_operation(
+                "LLM (Re-parsing)",
+                agent.parse_intent,
+                text, running_apps, installed_apps, 
+                chrome_tabs=chrome_tabs, chrome_tabs_raw=chrome_tabs_raw, 
+                available_presets=available_presets,
+                recent_files=recent_files, active_projects=active_projects, 
+                current_project=current_project
+            )
     else:
         # User confirmed, proceed with original intent
-        print("   Text confirmed, proceeding with command.\n")
+        logger.info("   Text confirmed, proceeding with command.")
     
     return text, intent
 
 
-def gather_context_parallel(file_tracker=None):
+def prefetch_context(file_tracker=None) -> Dict[str, Future]:
+    """
+    Start fetching context in the background so it is ready when a hotkey fires.
+    
+    Chrome tabs are not prefetched: reading uncached tab content activates Chrome,
+    which would steal focus from whatever the previous command just brought forward.
+    
+    Args:
+        file_tracker: Optional FileContextTracker instance
+        
+    Returns:
+        Dict mapping context names to futures, for gather_context_parallel
+    """
+    futures = {'running_apps': _prefetch_executor.submit(list_running_apps)}
+    if file_tracker:
+        futures['file_context'] = _prefetch_executor.submit(file_tracker.snapshot)
+    return futures
+
+
+def gather_context_parallel(file_tracker=None, prefetched: Optional[Dict[str, Future]] = None):
     """
     Gather context in parallel for faster execution.
     
     Args:
         file_tracker: Optional FileContextTracker instance
+        prefetched: Optional futures from prefetch_context to use instead of fetching again
         
     Returns:
         Tuple of (running_apps, chrome_tabs, chrome_tabs_raw, recent_files, active_projects, current_project)
@@ -166,54 +389,140 @@ def gather_context_parallel(file_tracker=None):
     active_projects = None
     current_project = None
     
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        # Submit all operations in parallel
-        futures = {
-            'running_apps': executor.submit(list_running_apps),
-            'chrome_tabs': executor.submit(list_chrome_tabs_with_content),
-        }
-        
-        # Submit file context operations if tracker exists
-        if file_tracker:
-            futures['recent_files'] = executor.submit(file_tracker.get_recent_files)
-            futures['active_projects'] = executor.submit(file_tracker.get_active_projects)
-            futures['current_project'] = executor.submit(file_tracker.get_current_project)
-        
-        # Collect results with error handling
+    prefetched = prefetched or {}
+    
+    # Prefetched file context resolves all three values at once
+    file_context_future = prefetched.get('file_context') if file_tracker else None
+    if file_context_future is not None:
         try:
-            running_apps = futures['running_apps'].result()
+            recent_files, active_projects, current_project = file_context_future.result()
         except Exception as e:
-            print(f"Warning: Failed to fetch running apps: {e}")
+            logger.warning("Failed to fetch file context: %s", e)
+            file_context_future = None
+    
+    futures = {}
+    
+    # Submit file context operations if tracker exists and they weren't prefetched
+    if file_tracker and file_context_future is None:
+        futures['file_context'] = _context_executor.submit(file_tracker.snapshot)
+    
+    # Only tab metadata is fetched here; tab contents are read per command by
+    # load_tab_contents when the command is about tabs
+    if 'running_apps' in prefetched:
+        try:
+            running_apps = prefetched['running_apps'].result()
+        except Exception as e:
+            logger.warning("Failed to fetch running apps: %s", e)
         
+        # Chrome is only queried when it is running (addressing it would launch it).
+        # The pool is only worth a hand-off when the file context is fetched alongside
+        if running_apps and "Google Chrome" in running_apps:
+            if futures:
+                futures['chrome_tabs'] = _context_executor.submit(list_chrome_tabs)
+            else:
+                try:
+                    chrome_tabs, chrome_tabs_raw = list_chrome_tabs()
+                except Exception as e:
+                    logger.warning("Failed to fetch Chrome tabs: %s", e)
+        else:
+            chrome_tabs = []
+    else:
+        # Nothing prefetched: fetch apps and the tab list in one osascript call,
+        # on this thread while the file context is fetched in the pool
+        try:
+            running_apps, chrome_tabs, chrome_tabs_raw = list_running_apps_and_chrome_tabs()
+        except Exception as e:
+            logger.warning("Failed to fetch running apps and Chrome tabs: %s", e)
+    
+    # Collect results with error handling
+    if 'chrome_tabs' in futures:
         try:
             chrome_tabs, chrome_tabs_raw = futures['chrome_tabs'].result()
         except Exception as e:
-            print(f"Warning: Failed to fetch Chrome tabs: {e}")
+            logger.warning("Failed to fetch Chrome tabs: %s", e)
             chrome_tabs = None
             chrome_tabs_raw = None
-        
-        if file_tracker:
-            try:
-                recent_files = futures['recent_files'].result()
-            except Exception as e:
-                print(f"Warning: Failed to fetch recent files: {e}")
-            
-            try:
-                active_projects = futures['active_projects'].result()
-            except Exception as e:
-                print(f"Warning: Failed to fetch active projects: {e}")
-            
-            try:
-                current_project = futures['current_project'].result()
-            except Exception as e:
-                print(f"Warning: Failed to fetch current project: {e}")
+    
+    if 'file_context' in futures:
+        try:
+            recent_files, active_projects, current_project = futures['file_context'].result()
+        except Exception as e:
+            logger.warning("Failed to fetch file context: %s", e)
     
     return running_apps, chrome_tabs, chrome_tabs_raw, recent_files, active_projects, current_project
 
 
+class SpeculativeIntent:
+    """
+    Parse intent on partial text before the final text is known.
+    
+    Used for partial transcripts while the hotkey is held and for draft edits in the
+    clarification dialog. By default a partial is only parsed once two consecutive
+    partials agree (LocalAgreement-2) and it has at least min_words words. The result
+    is reused if the final text matches the speculated text; otherwise it is discarded
+    and parsing happens normally.
+    """
+    
+    def __init__(self, parse, min_words: int = 3, require_agreement: bool = True):
+        """
+        Args:
+            parse: Callable taking the command text and returning an intent dict
+                (bound to the context snapshot captured at hotkey press)
+            min_words: Minimum number of words before a partial is parsed
+            require_agreement: Only parse a partial once it was received twice in a row
+        """
+        self._parse = parse
+        self._min_words = min_words
+        self._require_agreement = require_agreement
+        self._lock = threading.Lock()
+        self._last_partial = None
+        self._text = None
+        self._future = None
+    
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return _normalize_command_text(text).rstrip(".!?")
+    
+    def on_partial(self, text: str):
+        """Receive a partial transcript (or draft text)."""
+        normalized = self._normalize(text)
+        with self._lock:
+            stable = normalized == self._last_partial or not self._require_agreement
+            self._last_partial = normalized
+            if not stable or normalized == self._text or len(normalized.split()) < self._min_words:
+                return
+            if self._future is not None:
+                self._future.cancel()
+            self._text = normalized
+            self._future = _speculative_executor.submit(self._parse, text)
+    
+    def result_for(self, text: str) -> Optional[dict]:
+        """
+        Get the speculative intent if it was parsed from the same text.
+        
+        Args:
+            text: Final transcript (or confirmed text)
+            
+        Returns:
+            Intent dict, or None if there is no matching speculative parse
+        """
+        with self._lock:
+            future, speculated_text = self._future, self._text
+        if future is None:
+            return None
+        if self._normalize(text) != speculated_text:
+            future.cancel()
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            logger.warning("Speculative intent parsing failed: %s", e)
+            return None
+
+
 def process_command(
     text: str,
-    agent: AIAgent,
+    agent: "AIAgent",
     running_apps: list,
     installed_apps: list,
     chrome_tabs: Optional[list],
@@ -223,7 +532,9 @@ def process_command(
     recent_files: Optional[list] = None,
     active_projects: Optional[list] = None,
     current_project: Optional[dict] = None,
-    state_snapshotter: Optional[Any] = None
+    state_snapshotter: Optional[Any] = None,
+    speculative_intent: Optional[SpeculativeIntent] = None,
+    intent_future: Optional[Future] = None
 ) -> bool:
     """
     Process a command from text input (voice or text mode).
@@ -241,29 +552,52 @@ def process_command(
         active_projects: List of active projects (optional)
         current_project: Current project dict (optional)
         state_snapshotter: StateSnapshotter instance (optional)
+        speculative_intent: Intent parsed from a partial transcript while recording (optional)
+        intent_future: Intent already being parsed for this text with the same context (optional)
         
     Returns:
         True if command was processed successfully, False otherwise
     """
     # Check for quit commands
-    if text.lower() in ["quit", "exit", "q"]:
+    if _is_quit_command(text):
         return False
     
-    # Chrome tabs should already be pre-loaded with content from main loop
-    # No need to fetch again here
+    chrome_tabs, chrome_tabs_raw, tab_contents_loaded = load_tab_contents(
+        text, running_apps, chrome_tabs, chrome_tabs_raw
+    )
+    if tab_contents_loaded:
+        # Any speculative or batched parse ran without tab contents
+        speculative_intent = None
+        if intent_future is not None:
+            intent_future.cancel()
+            intent_future = None
     
     # Parse intent using AI agent
-    print(f"\n📝 Processing: '{text}'...")
-    intent_result = time_operation(
-        "LLM (Intent Parsing)",
-        agent.parse_intent,
-        text, running_apps, installed_apps, 
-        chrome_tabs=chrome_tabs, chrome_tabs_raw=chrome_tabs_raw, 
-        available_presets=available_presets,
-        recent_files=recent_files, active_projects=active_projects, 
-        current_project=current_project,
-        state_snapshotter=state_snapshotter
-    )
+    logger.info("📝 Processing: '%s'...", text)
+    # Show the transcript and status before the (possibly multi-second) parse
+    sys.stdout.flush()
+    intent_result = None
+    if speculative_intent is not None:
+        intent_result = time_operation("LLM (Speculative Intent)", speculative_intent.result_for, text)
+        if intent_result is not None:
+            # Parsed with the cache bypassed; store it now that the final text is known
+            agent.cache_intent(text, intent_result)
+    elif intent_future is not None:
+        try:
+            intent_result = time_operation("LLM (Batched Intent)", intent_future.result)
+        except Exception as e:
+            logger.warning("Batched intent parsing failed: %s", e)
+    if intent_result is None:
+        intent_result = time_operation(
+            "LLM (Intent Parsing)",
+            agent.parse_intent,
+            text, running_apps, installed_apps, 
+            chrome_tabs=chrome_tabs, chrome_tabs_raw=chrome_tabs_raw, 
+            available_presets=available_presets,
+            recent_files=recent_files, active_projects=active_projects, 
+            current_project=current_project,
+            state_snapshotter=state_snapshotter
+        )
     
     # Handle clarification if needed
     text, intent_result = handle_clarification(
@@ -278,9 +612,10 @@ def process_command(
         return True
     
     # Show feedback for multiple commands
-    commands_list = intent_result.get("commands", [])
-    if len(commands_list) > 1:
-        print(f"✓ Detected {len(commands_list)} commands\n")
+    commands_count = len(intent_result.get("commands") or ())
+    if commands_count > 1:
+        logger.info("✓ Detected %d commands", commands_count)
+        sys.stdout.flush()
     
     # Execute command(s) using command executor
     command_executor.execute(
@@ -292,38 +627,24 @@ def process_command(
         current_project=current_project
     )
     
-    # Track command in history (if cache is enabled)
-    cache_manager = get_cache_manager()
+    # Track command in history (if cache is enabled); written in the background
+    cache_manager = command_executor.cache_manager
     if cache_manager:
-        try:
-            cache_manager.add_to_history(text)
-        except Exception as e:
-            # Silently fail if cache is not available
-            pass
+        cache_manager.add_to_history_async(text)
     
     return True
 
 
 def main():
     """Main loop for the voice agent."""
+    # Status and timing output goes through logging so it is only formatted when enabled
+    logging.basicConfig(
+        level=getattr(logging, LOG_LEVEL, logging.INFO),
+        format="%(message)s",
+        handlers=[_DeferredFlushHandler(sys.stdout)]
+    )
     print_help()
     
-    # Pre-load Whisper model if using Whisper engine (reduces delay on hotkey press)
-    whisper_engine = None
-    if STT_ENGINE.lower() == "whisper":
-        try:
-            from .stt.engines.whisper_engine import preload_whisper_model, WhisperSTTEngine
-            print("🔄 Pre-loading Whisper model...")
-            preload_whisper_model(WHISPER_MODEL)
-            print("🔄 Starting persistent microphone stream...")
-            whisper_engine = WhisperSTTEngine.initialize_persistent_stream()
-            # Set the cached engine so factory uses the initialized instance
-            set_cached_engine(whisper_engine)
-            print()
-        except Exception as e:
-            print(f"⚠️  Warning: Could not initialize Whisper: {e}")
-            print("   Model will be loaded on first use.\n")
-    
     # Initialize cache manager first (needed for AI agent if LLM cache is enabled)
     if CACHE_ENABLED:
         try:
@@ -335,11 +656,57 @@ def main():
             print("Cache manager initialized.\n")
         except Exception as e:
             print(f"Warning: Could not initialize cache manager: {e}\n")
+    # Resolved once and handed to the components that use it
+    cache_manager = get_cache_manager()
+    
+    # Cleanup for everything started below, registered as each piece comes up so every
+    # exit path (quit, Ctrl+C) stops the same set of threads and streams
+    cleanup = contextlib.ExitStack()
+    if cache_manager:
+        cleanup.callback(cache_manager.flush_history)
+    
+    # Model loading, microphone setup, LLM client setup, the installed apps scan and preset
+    # loading are independent, so run them concurrently (startup takes the longest of them,
+    # not the sum)
+    startup_executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix="startup")
+    whisper_preload_future = None
+    whisper_stream_future = None
+    if STT_ENGINE.lower() == "whisper":
+        try:
+            from .stt.engines.whisper_engine import preload_whisper_model, WhisperSTTEngine
+            print("🔄 Pre-loading Whisper model and starting persistent microphone stream...")
+            whisper_preload_future = startup_executor.submit(preload_whisper_model, WHISPER_MODEL)
+            whisper_stream_future = startup_executor.submit(WhisperSTTEngine.initialize_persistent_stream)
+        except Exception as e:
+            print(f"⚠️  Warning: Could not initialize Whisper: {e}")
+            print("   Model will be loaded on first use.\n")
+    
+    agent_future = startup_executor.submit(
+        create_agent, cache_manager=cache_manager if LLM_CACHE_ENABLED else None
+    )
+    installed_apps_future = startup_executor.submit(list_installed_apps)
+    presets_future = startup_executor.submit(load_presets)
+    # Whisper keeps loading in the background; it is only waited on at the first voice press
+    startup_executor.shutdown(wait=False)
+    whisper_engine = None
+    whisper_pending = whisper_preload_future is not None
+    
+    def stop_whisper_stream():
+        """Stop the persistent microphone stream if it came up (even if never used)."""
+        engine = whisper_engine
+        if engine is None and whisper_stream_future is not None and whisper_stream_future.done() \
+                and whisper_stream_future.exception() is None:
+            engine = whisper_stream_future.result()
+        if engine is not None:
+            engine._stop_persistent_stream()
+    
+    cleanup.callback(stop_whisper_stream)
     
     # Initialize AI agent
     try:
-        agent = AIAgent(cache_manager=get_cache_manager() if LLM_CACHE_ENABLED else None)
+        agent = agent_future.result()
         print("AI agent initialized successfully.\n")
+        threading.Thread(target=agent.warmup_connection, daemon=True).start()
     except Exception as e:
         print(f"Error initializing AI agent: {e}")
         print("Please check your LLM endpoint configuration.")
@@ -355,41 +722,50 @@ def main():
         except Exception as e:
             print(f"Warning: Could not initialize auto-complete engine: {e}\n")
     
-    # Get installed apps once (for context)
-    installed_apps = list_installed_apps()
+    # Get installed apps once (for context). Frozen into an interned tuple so every
+    # command shares one immutable list and app-name comparisons hit identity first
+    installed_apps = tuple(sys.intern(app) for app in installed_apps_future.result())
+    
+    # Warm up the LLM in the background so the first command isn't a cold request
+    threading.Thread(target=agent.warmup, args=(installed_apps,), daemon=True).start()
     
     # Load presets at startup
-    presets = load_presets()
-    available_presets = list_presets(presets) if presets else []
+    presets = presets_future.result()
+    # Presets don't change while running, so keep the names immutable
+    available_presets = tuple(list_presets(presets)) if presets else ()
     if available_presets:
         print(f"📋 Loaded {len(available_presets)} preset(s): {', '.join(available_presets)}\n")
     else:
         print("📋 No presets configured. Create ~/.voice_agent_presets.json or presets.json to use presets.\n")
     
     # Initialize command executor
-    command_executor = CommandExecutor()
+    command_executor = CommandExecutor(cache_manager=cache_manager)
     
     # Start local API server for external UI clients (e.g., Electron)
     try:
-        from .api_server import start_api_server
-        from .config import API_PORT
         start_api_server(autocomplete_engine=autocomplete_engine, port=API_PORT)
         print(f"Local API server started on http://127.0.0.1:{API_PORT}\n")
     except Exception as e:
         print(f"Warning: Could not start local API server: {e}\n")
 
+    # Both hotkeys signal one event, so the main loop can sleep until there is work
+    # instead of polling each listener (queued API commands have their own worker)
+    wake_event = threading.Event()
+    
     # Initialize hotkey listeners
     try:
-        voice_hotkey_listener = HotkeyListener(hotkey=HOTKEY)
+        voice_hotkey_listener = HotkeyListener(hotkey=HOTKEY, notify_event=wake_event)
         voice_hotkey_listener.start()
+        cleanup.callback(voice_hotkey_listener.stop)
     except Exception as e:
         print(f"Error initializing voice hotkey listener: {e}")
         print("Please check your Accessibility permissions in System Settings.")
         sys.exit(1)
     
     try:
-        text_hotkey_listener = HotkeyListener(hotkey=TEXT_HOTKEY)
+        text_hotkey_listener = HotkeyListener(hotkey=TEXT_HOTKEY, notify_event=wake_event)
         text_hotkey_listener.start()
+        cleanup.callback(text_hotkey_listener.stop)
     except Exception as e:
         print(f"Error initializing text hotkey listener: {e}")
         print("Please check your Accessibility permissions in System Settings.")
@@ -400,7 +776,6 @@ def main():
     if FILE_CONTEXT_ENABLED:
         try:
             from .file_context import FileContextTracker
-            cache_manager = get_cache_manager()
             file_tracker = FileContextTracker(cache_manager=cache_manager)
             print("📁 File context tracking enabled\n")
         except Exception as e:
@@ -413,6 +788,7 @@ def main():
         try:
             activity_monitor = ActivityMonitor()
             activity_monitor.start()
+            cleanup.callback(activity_monitor.stop)
             print("🔍 System activity monitoring enabled\n")
         except Exception as e:
             print(f"Warning: Failed to initialize activity monitor: {e}\n")
@@ -425,146 +801,253 @@ def main():
             state_snapshotter = StateSnapshotter()
             print("📸 State snapshotting enabled\n")
             
-            # Start background thread to update snapshot periodically
-            import threading
+            # Start background thread to update snapshot periodically (stopped on shutdown)
+            snapshot_stop = threading.Event()
+            
             def update_snapshot_periodically():
-                while True:
+                while not snapshot_stop.wait(STATE_SNAPSHOT_INTERVAL):
                     try:
-                        time.sleep(STATE_SNAPSHOT_INTERVAL)
-                        if state_snapshotter:
-                            state_snapshotter.update_snapshot()
+                        state_snapshotter.update_snapshot()
                     except Exception as e:
-                        print(f"Warning: Failed to update state snapshot in background: {e}")
-                        time.sleep(STATE_SNAPSHOT_INTERVAL)
+                        logger.warning("Failed to update state snapshot in background: %s", e)
             
             snapshot_update_thread = threading.Thread(target=update_snapshot_periodically, daemon=True)
             snapshot_update_thread.start()
+            cleanup.callback(snapshot_stop.set)
         except Exception as e:
             print(f"Warning: Failed to initialize state snapshotter: {e}\n")
             state_snapshotter = None
     
+    def shutdown(prefetched: Optional[Dict[str, Future]]):
+        """Stop background work and listeners before exiting the main loop."""
+        quit_requested.set()
+        if prefetched is not None:
+            for future in prefetched.values():
+                future.cancel()
+        cleanup.close()
+    
+    # From here on stdout is flushed explicitly before each slow step of a command and
+    # before waiting for input, instead of once per line
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+    
+    # Commands run one at a time: the executor and the clarification dialog are shared
+    # between hotkey commands and queued API commands
+    command_lock = threading.Lock()
+    quit_requested = threading.Event()
+    
+    def run_queued_commands():
+        """Process commands submitted via the local API (e.g., Electron) as they arrive."""
+        while not quit_requested.is_set():
+            try:
+                queued_commands = wait_for_commands(max_items=_QUEUE_BATCH_SIZE)
+                if not queued_commands:
+                    continue
+                
+                # Gather context in parallel for faster execution
+                running_apps, chrome_tabs, chrome_tabs_raw, recent_files, active_projects, current_project = gather_context_parallel(
+                    file_tracker
+                )
+                
+                # The LLM round trips are independent, so parse every queued command
+                # up front; execution below stays sequential since it changes system state
+                intent_futures = [
+                    _intent_executor.submit(
+                        agent.parse_intent,
+                        text, running_apps, installed_apps,
+                        chrome_tabs=chrome_tabs, chrome_tabs_raw=chrome_tabs_raw,
+                        available_presets=available_presets,
+                        recent_files=recent_files, active_projects=active_projects,
+                        current_project=current_project,
+                        state_snapshotter=state_snapshotter
+                    ) if len(queued_commands) > 1 and not _is_quit_command(text) else None
+                    for text in queued_commands
+                ]
+                
+                with command_lock:
+                    for index, text in enumerate(queued_commands):
+                        should_continue = run_profiled(
+                            process_command,
+                            text, agent, running_apps, installed_apps, chrome_tabs, chrome_tabs_raw, available_presets, command_executor,
+                            recent_files=recent_files, active_projects=active_projects,
+                            current_project=current_project,
+                            state_snapshotter=state_snapshotter,
+                            intent_future=intent_futures[index]
+                        )
+                        if not should_continue:
+                            for future in intent_futures[index + 1:]:
+                                if future is not None:
+                                    future.cancel()
+                            # The main loop owns shutdown
+                            quit_requested.set()
+                            wake_event.set()
+                            return
+                logger.info(_WAITING_MSG)
+                sys.stdout.flush()
+            except Exception as e:
+                logger.warning("Failed to process queued commands: %s", e)
+    
+    threading.Thread(target=run_queued_commands, name="command-queue", daemon=True).start()
+    
     # Main loop - wait for hotkey, then process command
-    print(f"👂 Waiting for hotkeys ({HOTKEY} for voice, {TEXT_HOTKEY} for text)...\n")
+    logger.info(_WAITING_MSG)
+    
+    # Static part of the Whisper prompt; the running apps segment is appended per command
+    context_parts = [
+        "macOS window control commands.",
+        "Commands: bring to view, focus, list apps, switch tab, place on monitor, move to screen, activate preset.",
+        "Monitor terms: main monitor, right monitor, left monitor, main screen, right screen, left screen."
+    ]
+    if available_presets:
+        context_parts.append(f"Available presets: {', '.join(available_presets)}.")
+    whisper_static_context = " ".join(context_parts)
+    whisper_apps_key = None
+    whisper_context = whisper_static_context
+    
+    # Context is fetched in the background after each command (and once here), so the
+    # AppleScript/Spotlight round-trips overlap with the wait for the next hotkey
+    prefetched_context = None
+    prefetched_at = 0.0
     
     while True:
         try:
+            if prefetched_context is None:
+                prefetched_context = prefetch_context(file_tracker)
+                prefetched_at = time.monotonic()
+            
+            # Block until a hotkey is pressed (or a queued quit command); nothing runs while idle
+            sys.stdout.flush()
+            wake_event.wait()
+            wake_event.clear()
+            
+            if quit_requested.is_set():
+                # Quit command from the queue
+                logger.info("Goodbye!")
+                shutdown(prefetched_context)
+                break
+            
             # Check for hotkeys FIRST - before any expensive operations
-            # This ensures minimal latency from hotkey press to response
-            voice_pressed = voice_hotkey_listener.wait_for_hotkey(timeout=0.1)
-            text_pressed = text_hotkey_listener.wait_for_hotkey(timeout=0.1)
+            # This ensures minimal latency from hotkey press to response.
+            # One hotkey is handled per iteration; a voice press that arrived together
+            # with a text press stays queued and is handled on the next wake-up
+            text_pressed = text_hotkey_listener.consume_press()
+            voice_pressed = not text_pressed and voice_hotkey_listener.consume_press()
+            if text_pressed and voice_hotkey_listener.has_pending_press():
+                # A voice press arrived together with this one; wake again to handle it
+                wake_event.set()
             
             # Handle text hotkey immediately - no context needed
             if text_pressed:
                 # Text hotkey - trigger Electron palette immediately
                 try:
                     trigger_palette()
-                    print("✅ Text hotkey pressed! Electron palette triggered.\n")
+                    logger.info("✅ Text hotkey pressed! Electron palette triggered.")
                 except Exception as e:
-                    print(f"Warning: Could not trigger Electron palette: {e}\n")
+                    logger.warning("Could not trigger Electron palette: %s", e)
                 continue  # Skip context gathering and other operations
             
             # Handle voice hotkey - gather context only when needed
             if voice_pressed:
                 # Voice mode: gather context now (after hotkey detected)
-                print("✅ Voice hotkey pressed! Listening... (hold to speak, release to process)\n")
+                logger.info("✅ Voice hotkey pressed! Listening... (hold to speak, release to process)")
                 
-                # Gather context in parallel for faster execution
-                running_apps, chrome_tabs, chrome_tabs_raw, recent_files, active_projects, current_project = gather_context_parallel(file_tracker)
+                # Context prefetched long before this press is too stale to act on; drop it
+                # so gather_context_parallel fetches fresh values
+                if prefetched_context is not None and time.monotonic() - prefetched_at > _PREFETCH_MAX_AGE:
+                    for future in prefetched_context.values():
+                        future.cancel()
+                    prefetched_context = None
                 
-                # Build context for Whisper transcription
-                context_parts = [
-                    "macOS window control commands.",
-                    "Commands: bring to view, focus, list apps, switch tab, place on monitor, move to screen, activate preset.",
-                    "Monitor terms: main monitor, right monitor, left monitor, main screen, right screen, left screen."
-                ]
+                # Whisper's prompt uses the prefetched running apps if they are ready;
+                # recording must not wait on AppleScript
+                apps_future = prefetched_context.get('running_apps') if prefetched_context else None
+                hint_apps = None
+                if apps_future is not None and apps_future.done() and apps_future.exception() is None:
+                    hint_apps = apps_future.result()
+                
+                # Gather the full context in the background while the user is speaking
+                context_future = _prefetch_executor.submit(
+                    gather_context_parallel, file_tracker, prefetched_context
+                )
+                prefetched_context = None  # Consumed; refreshed after this command
                 
-                if available_presets:
-                    context_parts.append(f"Available presets: {', '.join(available_presets)}.")
+                # Build context for Whisper transcription (only the apps segment can change)
+                apps_key = tuple(hint_apps[:20]) if hint_apps else ()
+                if apps_key != whisper_apps_key:
+                    whisper_apps_key = apps_key
+                    whisper_context = whisper_static_context
+                    if apps_key:
+                        # Limit to first 20 apps to keep context manageable
+                        whisper_context += f" Running applications: {', '.join(apps_key)}."
+                context = whisper_context
                 
-                if running_apps:
-                    # Limit to first 20 apps to keep context manageable
-                    apps_list = ", ".join(running_apps[:20])
-                    context_parts.append(f"Running applications: {apps_list}.")
+                def parse_with_gathered_context(command_text):
+                    (running_apps, chrome_tabs, chrome_tabs_raw,
+                     recent_files, active_projects, current_project) = context_future.result()
+                    return agent.parse_intent(
+                        command_text, running_apps, installed_apps,
+                        chrome_tabs=chrome_tabs, chrome_tabs_raw=chrome_tabs_raw,
+                        available_presets=available_presets,
+                        recent_files=recent_files, active_projects=active_projects,
+                        current_project=current_project,
+                        state_snapshotter=state_snapshotter,
+                        use_cache=False
+                    )
                 
-                context = " ".join(context_parts)
+                # Intent parsing can start on stable partial transcripts, using the
+                # context gathered at hotkey press. Partials bypass the LLM cache;
+                # process_command stores the intent once the final text matches
+                speculative_intent = SpeculativeIntent(parse_with_gathered_context)
+                
+                # The first press waits for the Whisper model if it is still loading
+                if whisper_pending:
+                    whisper_pending = False
+                    whisper_engine = finish_whisper_startup(whisper_preload_future, whisper_stream_future)
                 
                 # Record while hotkey is held (starts immediately, no delay)
+                sys.stdout.flush()
                 text = time_operation(
                     "STT (Speech Recognition)",
                     transcribe_while_held,
                     voice_hotkey_listener.is_hotkey_pressed,
-                    context
+                    context,
+                    speculative_intent.on_partial
                 )
                 
                 if not text:
-                    print(f"👂 Waiting for hotkeys ({HOTKEY} for voice, {TEXT_HOTKEY} for text)...\n")
+                    logger.info(_WAITING_MSG)
                     continue
                 
+                # Context was gathered during recording, so this is normally ready
+                (running_apps, chrome_tabs, chrome_tabs_raw,
+                 recent_files, active_projects, current_project) = context_future.result()
+                
                 # Process the command with gathered context
-                should_continue = process_command(
-                    text, agent, running_apps, installed_apps, chrome_tabs, chrome_tabs_raw, available_presets, command_executor,
-                    recent_files=recent_files, active_projects=active_projects,
-                    current_project=current_project,
-                    state_snapshotter=state_snapshotter
-                )
+                with command_lock:
+                    should_continue = run_profiled(
+                        process_command,
+                        text, agent, running_apps, installed_apps, chrome_tabs, chrome_tabs_raw, available_presets, command_executor,
+                        recent_files=recent_files, active_projects=active_projects,
+                        current_project=current_project,
+                        state_snapshotter=state_snapshotter,
+                        speculative_intent=speculative_intent
+                    )
                 
                 if not should_continue:
                     # Quit command
-                    print("Goodbye!")
-                    voice_hotkey_listener.stop()
-                    text_hotkey_listener.stop()
-                    if whisper_engine is not None:
-                        whisper_engine._stop_persistent_stream()
-                    if activity_monitor:
-                        activity_monitor.stop()
+                    logger.info("Goodbye!")
+                    shutdown(prefetched_context)
                     break
                 
-                print(f"\n👂 Waiting for hotkeys ({HOTKEY} for voice, {TEXT_HOTKEY} for text)...\n")
-                continue  # Skip periodic maintenance on this iteration
+                logger.info(_WAITING_MSG)
             
-            # No hotkey pressed - do periodic maintenance (only occasionally to avoid blocking)
-            # State snapshot is updated in background thread, no need to update here
-            
-            # Drain any queued commands submitted via local API (e.g., Electron)
-            # Gather context only when processing queued commands
-            try:
-                from .command_queue import drain_commands
-                queued_commands = drain_commands(max_items=10)
-                if queued_commands:
-                    # Gather context in parallel for faster execution
-                    running_apps, chrome_tabs, chrome_tabs_raw, recent_files, active_projects, current_project = gather_context_parallel(file_tracker)
-                    
-                    for text in queued_commands:
-                        should_continue = process_command(
-                            text, agent, running_apps, installed_apps, chrome_tabs, chrome_tabs_raw, available_presets, command_executor,
-                            recent_files=recent_files, active_projects=active_projects,
-                            current_project=current_project,
-                            state_snapshotter=state_snapshotter
-                        )
-                        if not should_continue:
-                            print("Goodbye!")
-                            voice_hotkey_listener.stop()
-                            text_hotkey_listener.stop()
-                            if whisper_engine is not None:
-                                whisper_engine._stop_persistent_stream()
-                            if activity_monitor:
-                                activity_monitor.stop()
-                            break
-            except Exception as e:
-                print(f"Warning: Failed to process queued commands: {e}")
-                
         except KeyboardInterrupt:
-            print("\n\nInterrupted. Goodbye!")
-            voice_hotkey_listener.stop()
-            text_hotkey_listener.stop()
-            if whisper_engine is not None:
-                whisper_engine._stop_persistent_stream()
-            if activity_monitor:
-                activity_monitor.stop()
+            logger.info("Interrupted. Goodbye!")
+            shutdown(prefetched_context)
             break
         except Exception as e:
-            print(f"Error: {e}\n")
-            print(f"👂 Waiting for hotkeys ({HOTKEY} for voice, {TEXT_HOTKEY} for text)...\n")
+            logger.error("%s", e)
+            logger.info(_WAITING_MSG)
 
 
 if __name__ == "__main__":
@@ -3,8 +3,10 @@
 from .activity_monitor import ActivityMonitor
 from .state_snapshotter import StateSnapshotter
 from .app_monitor import list_running_apps, list_installed_apps, get_active_app
-from .tab_monitor import list_chrome_tabs, list_chrome_tabs_with_content, get_active_chrome_tab
-from .window_monitor import get_window_bounds, get_all_windows
+from .tab_monitor import (
+    list_chrome_tabs, list_chrome_tabs_with_content, list_running_apps_and_chrome_tabs, get_active_chrome_tab
+)
+from .window_monitor import get_window_bounds, get_all_windows, list_apps_with_windows
 from .system_context import get_system_info
 
 __all__ = [
@@ -15,9 +17,11 @@ __all__ = [
     'get_active_app',
     'list_chrome_tabs',
     'list_chrome_tabs_with_content',
+    'list_running_apps_and_chrome_tabs',
     'get_active_chrome_tab',
     'get_window_bounds',
     'get_all_windows',
+    'list_apps_with_windows',
     'get_system_info',
 ]
 
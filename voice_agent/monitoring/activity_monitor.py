@@ -1,8 +1,9 @@
 """Activity monitor for tracking system-level changes using polling."""
 
+import heapq
 import threading
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from ..config import (
     SYSTEM_MONITOR_ENABLED,
     SYSTEM_MONITOR_APP_INTERVAL,
@@ -16,6 +17,20 @@ from .app_monitor import get_active_app
 from .tab_monitor import get_active_chrome_tab
 from .window_monitor import get_window_bounds
 
+# Shortest time the monitor loop sleeps between checks, even with zero intervals
+_MIN_WAIT = 0.1
+
+# Polling interval for each scheduled check in the monitor loop
+_CHECK_INTERVALS = {
+    "app": SYSTEM_MONITOR_APP_INTERVAL,
+    "tab": SYSTEM_MONITOR_TAB_INTERVAL,
+    "window": SYSTEM_MONITOR_WINDOW_INTERVAL,
+}
+
+# Cooldown timestamps are pruned past this many keys, keeping those from the last minute
+_MAX_COOLDOWN_KEYS = 4096
+_COOLDOWN_KEY_MAX_AGE_NS = 60_000_000_000
+
 
 class ActivityMonitor:
     """Monitors system activity and logs changes to activity history."""
@@ -24,6 +39,7 @@ class ActivityMonitor:
         """Initialize the activity monitor."""
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
         self._cache_manager = get_cache_manager()
         
         # Track previous state for change detection
@@ -32,8 +48,8 @@ class ActivityMonitor:
         self._previous_bounds: Optional[Dict[str, tuple[int, int, int, int]]] = {}  # app_name -> bounds
         
         # Track last activity timestamp per action type to avoid duplicate logging
-        self._last_activity_timestamps: Dict[str, float] = {}
-        self._cooldown_period = 0.5  # 0.5 seconds cooldown between same action type
+        self._last_activity_timestamps: Dict[Tuple[str, Any], int] = {}
+        self._cooldown_ns = 500_000_000  # 0.5 seconds cooldown between same action type
     
     def start(self) -> None:
         """Start monitoring in a background thread."""
@@ -44,57 +60,74 @@ class ActivityMonitor:
             return
         
         self._running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self._thread.start()
     
     def stop(self) -> None:
         """Stop monitoring gracefully."""
         self._running = False
+        self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=2.0)
         self._thread = None
     
     def _monitor_loop(self) -> None:
-        """Main polling loop with conditional checks."""
-        last_app_check = 0
-        last_tab_check = 0
-        last_window_check = 0
+        """Main monitoring loop; sleeps until the next scheduled check is due."""
+        # Min-heap of (deadline, check kind); every check is due immediately on start
+        schedule: List[Tuple[float, str]] = [(0.0, kind) for kind in _CHECK_INTERVALS]
         
         while self._running:
             try:
-                current_time = time.time()
+                current_time = time.monotonic()
                 
-                # Poll active app (every app_interval seconds)
-                if current_time - last_app_check >= SYSTEM_MONITOR_APP_INTERVAL:
-                    self._check_app_change()
-                    last_app_check = current_time
+                due = []
+                while schedule and schedule[0][0] <= current_time:
+                    _, kind = heapq.heappop(schedule)
+                    due.append(kind)
                 
-                # Poll Chrome tabs (every tab_interval seconds, only if Chrome is active)
-                if current_time - last_tab_check >= SYSTEM_MONITOR_TAB_INTERVAL:
-                    active_app = get_active_app()
-                    if active_app == "Google Chrome":
-                        self._check_tab_change()
-                    last_tab_check = current_time
+                for kind in due:
+                    # Re-arm before running so a failing check keeps its place in the schedule;
+                    # the floor keeps a zero interval from being due again this tick
+                    heapq.heappush(schedule, (current_time + max(_CHECK_INTERVALS[kind], _MIN_WAIT), kind))
                 
-                # Poll window bounds (every window_interval seconds, only for active app)
-                if current_time - last_window_check >= SYSTEM_MONITOR_WINDOW_INTERVAL:
+                if due:
+                    # Query the frontmost app once and share it across every check due this tick
                     active_app = get_active_app()
-                    if active_app:
-                        self._check_window_change(active_app)
-                    last_window_check = current_time
+                    for kind in due:
+                        self._run_check(kind, active_app)
                 
-                # Sleep for a short interval to avoid busy-waiting
-                time.sleep(0.1)
+                # Block until the earliest check is due; stop() sets the event so
+                # shutdown doesn't wait out the timeout
+                self._stop_event.wait(max(_MIN_WAIT, schedule[0][0] - time.monotonic()))
                 
             except Exception as e:
                 # Continue monitoring even if one check fails
                 print(f"Warning: Activity monitor error: {e}")
-                time.sleep(1.0)
+                self._stop_event.wait(1.0)
+    
+    def _run_check(self, kind: str, active_app: Optional[str]) -> None:
+        """
+        Run one scheduled check.
+        
+        Args:
+            kind: Check to run ("app", "tab" or "window")
+            active_app: Frontmost app name for this tick (None if unknown)
+        """
+        if kind == "app":
+            self._check_app_change(active_app)
+        elif kind == "tab":
+            # Chrome tabs are only polled while Chrome is active
+            if active_app == "Google Chrome":
+                self._check_tab_change()
+        elif kind == "window":
+            # Window bounds are only polled for the active app
+            if active_app:
+                self._check_window_change(active_app)
     
-    def _check_app_change(self) -> None:
+    def _check_app_change(self, current_app: Optional[str]) -> None:
         """Check if active app has changed and log if so."""
         try:
-            current_app = get_active_app()
             if current_app and current_app != self._previous_app:
                 # Check cooldown
                 if not self._should_log_activity("activate_app", current_app):
@@ -112,9 +145,6 @@ class ActivityMonitor:
                     )
                 
                 self._previous_app = current_app
-                # Reset window bounds tracking for new app
-                if current_app not in self._previous_bounds:
-                    self._previous_bounds[current_app] = None
         except Exception:
             pass  # Fail silently
     
@@ -159,12 +189,9 @@ class ActivityMonitor:
             if not current_bounds:
                 return
             
-            previous_bounds = self._previous_bounds.get(app_name)
-            
-            # Check if bounds changed significantly
-            if previous_bounds is None:
-                # First time seeing this app's window, just store bounds
-                self._previous_bounds[app_name] = current_bounds
+            # First time seeing this app's window just stores its bounds
+            previous_bounds = self._previous_bounds.setdefault(app_name, current_bounds)
+            if previous_bounds == current_bounds:
                 return
             
             # Calculate change distance
@@ -207,13 +234,18 @@ class ActivityMonitor:
         Returns:
             True if should log, False if in cooldown
         """
-        key = f"{action_type}:{identifier}"
-        current_time = time.time()
-        last_time = self._last_activity_timestamps.get(key, 0)
+        key = (action_type, identifier)
+        now = time.monotonic_ns()
+        last_time = self._last_activity_timestamps.get(key)
         
-        if current_time - last_time < self._cooldown_period:
+        if last_time is not None and now - last_time < self._cooldown_ns:
             return False
         
-        self._last_activity_timestamps[key] = current_time
+        self._last_activity_timestamps[key] = now
+        # Keys accumulate per app and tab seen; drop ones long past their cooldown
+        if len(self._last_activity_timestamps) > _MAX_COOLDOWN_KEYS:
+            cutoff = now - _COOLDOWN_KEY_MAX_AGE_NS
+            self._last_activity_timestamps = {
+                k: t for k, t in self._last_activity_timestamps.items() if t >= cutoff
+            }
         return True
-
@@ -1,7 +1,10 @@
 """Application monitoring functions using AppleScript."""
 
 import os
-from typing import List, Optional
+import json
+import ctypes
+import sys
+from typing import Dict, List, Optional, Tuple
 from ..utils import AppleScriptExecutor
 from ..config import CACHE_APPS_TTL
 from ..cache import get_cache_manager
@@ -9,6 +12,47 @@ from ..cache import get_cache_manager
 # Create a module-level executor instance
 _executor = AppleScriptExecutor()
 
+# libproc's proc_listpids, used for a cheap process-set fingerprint (macOS only)
+_PROC_ALL_PIDS = 1
+_libproc = None
+if sys.platform == "darwin":
+    try:
+        _libproc = ctypes.CDLL("/usr/lib/libproc.dylib")
+        _libproc.proc_listpids.argtypes = [ctypes.c_uint32, ctypes.c_uint32, ctypes.c_void_p, ctypes.c_int]
+        _libproc.proc_listpids.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _libproc = None
+
+# Last enumerated running apps and the process-set fingerprint they were read at
+_last_running_apps: Optional[Tuple[int, List[str]]] = None
+
+
+def _process_fingerprint() -> Optional[int]:
+    """
+    Get a fingerprint of the current set of process IDs.
+    
+    Listing PIDs is a single syscall, far cheaper than asking System Events for
+    process names, so an unchanged fingerprint lets the last app list be reused.
+    
+    Returns:
+        Hash of the sorted PID set, or None if unavailable on this platform
+    """
+    if _libproc is None:
+        return None
+    try:
+        size = _libproc.proc_listpids(_PROC_ALL_PIDS, 0, None, 0)
+        if size <= 0:
+            return None
+        # Leave headroom for processes started between the two calls
+        count = size // ctypes.sizeof(ctypes.c_int) + 32
+        pids = (ctypes.c_int * count)()
+        size = _libproc.proc_listpids(_PROC_ALL_PIDS, 0, pids, ctypes.sizeof(pids))
+        if size <= 0:
+            return None
+        return hash(tuple(sorted(pid for pid in pids[:size // ctypes.sizeof(ctypes.c_int)] if pid)))
+    except Exception:
+        return None
+
 
 def get_active_app() -> Optional[str]:
     """
@@ -35,7 +79,7 @@ def get_active_app() -> Optional[str]:
 def list_running_apps() -> List[str]:
     """
     Get a list of currently running, non-background applications.
-    Uses cache if enabled.
+    Uses cache if enabled, and reuses the last list while the set of processes is unchanged.
     
     Returns:
         List of application names (strings)
@@ -47,7 +91,16 @@ def list_running_apps() -> List[str]:
         if cached is not None:
             return cached
     
-    # Cache miss - fetch from system
+    # Cache miss - skip enumerating if no process started or exited since the last one
+    global _last_running_apps
+    fingerprint = _process_fingerprint()
+    if fingerprint is not None and _last_running_apps is not None and _last_running_apps[0] == fingerprint:
+        apps = _last_running_apps[1]
+        if cache_manager:
+            cache_manager.set_apps("running", apps, ttl=CACHE_APPS_TTL)
+        return apps
+    
+    # Fetch from system
     try:
         # Use linefeed delimiter to avoid issues with commas in app names
         script = '''
@@ -73,6 +126,8 @@ def list_running_apps() -> List[str]:
         apps = [app.strip() for app in stdout.strip().split('\n') if app.strip()] if stdout else []
         
         # Cache the result
+        if fingerprint is not None:
+            _last_running_apps = (fingerprint, apps)
         if cache_manager:
             cache_manager.set_apps("running", apps, ttl=CACHE_APPS_TTL)
         
@@ -82,10 +137,60 @@ def list_running_apps() -> List[str]:
         return []
 
 
+# Directories scanned for installed applications
+_APP_DIRS = [
+    "/Applications",
+    "/Applications/Utilities",
+    "/System/Applications",
+    "/System/Applications/Utilities",
+    "/System/Library/CoreServices",  # Finder.app and other system apps
+    os.path.expanduser("~/Applications"),
+]
+
+# Installed apps persisted across runs, keyed by the mtimes of _APP_DIRS
+_INSTALLED_APPS_CACHE_PATH = os.path.expanduser("~/.voice_agent_installed_apps.json")
+
+# Last installed apps list in this process, with the app directory mtimes it is valid for
+_installed_apps_memo: Optional[Tuple[Dict[str, Optional[float]], List[str]]] = None
+
+
+def _get_app_dir_mtimes() -> Dict[str, Optional[float]]:
+    """Get the modification time of each app directory (None if missing)."""
+    mtimes = {}
+    for base in _APP_DIRS:
+        try:
+            mtimes[base] = os.stat(base).st_mtime
+        except OSError:
+            mtimes[base] = None
+    return mtimes
+
+
+def _load_installed_apps_from_disk(mtimes: Dict[str, Optional[float]]) -> Optional[List[str]]:
+    """Load the persisted installed apps list if no app directory changed since it was saved."""
+    try:
+        with open(_INSTALLED_APPS_CACHE_PATH, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict) and data.get("mtimes") == mtimes and isinstance(data.get("apps"), list):
+            return data["apps"]
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _save_installed_apps_to_disk(apps: List[str], mtimes: Dict[str, Optional[float]]) -> None:
+    """Persist the installed apps list with the app directory mtimes it was scanned at."""
+    try:
+        with open(_INSTALLED_APPS_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({"mtimes": mtimes, "apps": apps}, f)
+    except OSError as e:
+        print(f"Warning: Failed to save installed apps cache to {_INSTALLED_APPS_CACHE_PATH}: {e}")
+
+
 def list_installed_apps() -> List[str]:
     """
     Get a list of installed applications from common macOS locations.
-    Uses cache if enabled.
+    Uses cache if enabled, then a disk cache that is reused until an app
+    directory's modification time changes (an app was added or removed).
     
     Returns:
         List of application names (without .app extension)
@@ -97,35 +202,48 @@ def list_installed_apps() -> List[str]:
         if cached is not None:
             return cached
     
+    global _installed_apps_memo
+    mtimes = _get_app_dir_mtimes()
+    # Nothing installed or removed since the last call: skip reading the disk cache
+    if _installed_apps_memo is not None and _installed_apps_memo[0] == mtimes:
+        apps = _installed_apps_memo[1]
+        if cache_manager:
+            cache_manager.set_apps("installed", apps, ttl=CACHE_APPS_TTL * 3)  # 3x TTL for installed apps
+        return apps
+    
+    apps = _load_installed_apps_from_disk(mtimes)
+    if apps is not None:
+        _installed_apps_memo = (mtimes, apps)
+        if cache_manager:
+            cache_manager.set_apps("installed", apps, ttl=CACHE_APPS_TTL * 3)  # 3x TTL for installed apps
+        return apps
+    
     # Cache miss - fetch from filesystem across multiple locations
     apps_set = set()
-    candidate_dirs = [
-        "/Applications",
-        "/Applications/Utilities",
-        "/System/Applications",
-        "/System/Applications/Utilities",
-        "/System/Library/CoreServices",  # Finder.app and other system apps
-        os.path.expanduser("~/Applications"),
-    ]
     
     try:
-        for base in candidate_dirs:
-            if not os.path.exists(base):
+        for base in _APP_DIRS:
+            if mtimes[base] is None:
+                continue
+            try:
+                with os.scandir(base) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".app"):
+                            # Remove .app extension
+                            apps_set.add(entry.name[:-4])
+            except OSError:
+                # An unreadable directory shouldn't drop the apps found elsewhere
                 continue
-            for item in os.listdir(base):
-                if item.endswith(".app"):
-                    # Remove .app extension
-                    app_name = item[:-4]
-                    apps_set.add(app_name)
         
         apps = sorted(apps_set)
         
         # Cache the result (longer TTL for installed apps)
         if cache_manager:
             cache_manager.set_apps("installed", apps, ttl=CACHE_APPS_TTL * 3)  # 3x TTL for installed apps
+        _save_installed_apps_to_disk(apps, mtimes)
+        _installed_apps_memo = (mtimes, apps)
         
         return apps
     except Exception as e:
         print(f"Error listing installed apps: {e}")
         return []
-
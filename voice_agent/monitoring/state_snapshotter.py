@@ -1,18 +1,30 @@
 """State snapshotter for capturing comprehensive system state."""
 
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from ..config import (
     STATE_SNAPSHOT_ENABLED,
     STATE_SNAPSHOT_INTERVAL,
     STATE_SNAPSHOT_INCLUDE_DOCUMENTS,
     STATE_SNAPSHOT_INCLUDE_ALL_TABS
 )
-from .app_monitor import list_running_apps, get_active_app
+from .app_monitor import get_active_app
 from .tab_monitor import list_chrome_tabs, list_chrome_tabs_with_content, get_active_chrome_tab
-from .window_monitor import get_all_windows, get_window_bounds
+from .window_monitor import list_apps_with_windows
 from .system_context import get_system_info
 
+# Status suffix for app and tab lines, indexed by is_active
+_STATUS = ("", "(active)")
+
+
+def _format_window_line(window: Dict[str, Any]) -> str:
+    """Format one window entry for the LLM state snapshot."""
+    bounds = window.get("bounds")
+    title = window.get("title", "Untitled")
+    if bounds:
+        return f"     - Window: {title} [{bounds[0]}, {bounds[1]}, {bounds[2]}, {bounds[3]}]"
+    return f"     - Window: {title}"
+
 
 class StateSnapshotter:
     """Captures and maintains comprehensive snapshots of current system state."""
@@ -21,6 +33,8 @@ class StateSnapshotter:
         """Initialize the state snapshotter."""
         self._last_snapshot_time = 0
         self._current_snapshot: Optional[Dict[str, Any]] = None
+        # Last formatted snapshot, keyed by (snapshot timestamp, active app)
+        self._formatted_cache: Optional[Tuple[Tuple[float, Optional[str]], str]] = None
     
     def get_full_snapshot(self) -> Dict[str, Any]:
         """
@@ -44,10 +58,12 @@ class StateSnapshotter:
             return
         
         try:
+            # Apps, windows and the frontmost app all come from one osascript call
+            inventory = list_apps_with_windows()
             snapshot = {
                 "timestamp": time.time(),
-                "apps": self.get_apps_snapshot(),
-                "windows": self.get_windows_snapshot(),
+                "apps": self.get_apps_snapshot(inventory),
+                "windows": self.get_windows_snapshot(inventory),
                 "tabs": self.get_tabs_snapshot(),
                 "system_context": get_system_info()
             }
@@ -61,20 +77,24 @@ class StateSnapshotter:
             print(f"Warning: Failed to update state snapshot: {e}")
             self._current_snapshot = {}
     
-    def get_apps_snapshot(self) -> List[Dict[str, Any]]:
+    def get_apps_snapshot(
+        self,
+        inventory: Optional[Tuple[Optional[str], List[Tuple[str, List[Dict[str, Any]]]]]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get snapshot of all running apps with window info.
         
+        Args:
+            inventory: Optional result of list_apps_with_windows() to reuse
+        
         Returns:
             List of app dicts with name, is_active, windows
         """
         try:
-            running_apps = list_running_apps()
-            active_app = get_active_app()
+            active_app, app_windows = inventory or list_apps_with_windows()
             
             apps = []
-            for app_name in running_apps:
-                windows = get_all_windows(app_name)
+            for app_name, windows in app_windows:
                 apps.append({
                     "name": app_name,
                     "is_active": app_name == active_app,
@@ -85,22 +105,27 @@ class StateSnapshotter:
         except Exception:
             return []
     
-    def get_windows_snapshot(self) -> List[Dict[str, Any]]:
+    def get_windows_snapshot(
+        self,
+        inventory: Optional[Tuple[Optional[str], List[Tuple[str, List[Dict[str, Any]]]]]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get snapshot of all windows across all apps.
         
+        Args:
+            inventory: Optional result of list_apps_with_windows() to reuse
+        
         Returns:
             List of window dicts with app_name, window details
         """
         try:
-            running_apps = list_running_apps()
+            _, app_windows = inventory or list_apps_with_windows()
             all_windows = []
             
-            for app_name in running_apps:
-                windows = get_all_windows(app_name)
+            for app_name, windows in app_windows:
                 for window in windows:
-                    window["app_name"] = app_name
-                    all_windows.append(window)
+                    # Copy so the per-app window dicts in the apps snapshot stay unchanged
+                    all_windows.append({**window, "app_name": app_name})
             
             return all_windows
         except Exception:
@@ -148,10 +173,15 @@ class StateSnapshotter:
         if not snapshot:
             return "=== CURRENT SYSTEM STATE ===\nNo state information available.\n"
         
+        # Active app is read live, so it is part of the key along with the snapshot it formats
+        active_app = get_active_app()
+        cache_key = (snapshot.get("timestamp", 0), active_app)
+        if self._formatted_cache is not None and self._formatted_cache[0] == cache_key:
+            return self._formatted_cache[1]
+        
         lines = ["=== CURRENT SYSTEM STATE ==="]
         
         # Active app
-        active_app = get_active_app()
         if active_app:
             lines.append(f"Active App: {active_app}")
         else:
@@ -162,34 +192,18 @@ class StateSnapshotter:
         if apps:
             lines.append(f"\nAll Running Apps ({len(apps)}):")
             for i, app in enumerate(apps, 1):
-                app_name = app.get("name", "Unknown")
-                is_active = app.get("is_active", False)
-                windows = app.get("windows", [])
-                
-                status = "(active)" if is_active else ""
-                lines.append(f"  {i}. {app_name} {status}")
-                
-                for window in windows:
-                    bounds = window.get("bounds")
-                    title = window.get("title", "Untitled")
-                    if bounds:
-                        lines.append(f"     - Window: {title} [{bounds[0]}, {bounds[1]}, {bounds[2]}, {bounds[3]}]")
-                    else:
-                        lines.append(f"     - Window: {title}")
+                lines.append(f"  {i}. {app.get('name', 'Unknown')} {_STATUS[bool(app.get('is_active', False))]}")
+                lines.extend(map(_format_window_line, app.get("windows", [])))
         
         # All Chrome tabs
         tabs = snapshot.get("tabs", [])
         if tabs:
             lines.append(f"\nAll Chrome Tabs ({len(tabs)}):")
-            for i, tab in enumerate(tabs, 1):
-                index = tab.get("index", i)
-                title = tab.get("title", "Untitled")
-                url = tab.get("url", "")
-                domain = tab.get("domain", "")
-                is_active = tab.get("is_active", False)
-                
-                status = "(active)" if is_active else ""
-                lines.append(f"  Tab {index} [{domain}] {status}: {title} | {url}")
+            lines.extend(
+                f"  Tab {tab.get('index', i)} [{tab.get('domain', '')}] {_STATUS[bool(tab.get('is_active', False))]}: "
+                f"{tab.get('title', 'Untitled')} | {tab.get('url', '')}"
+                for i, tab in enumerate(tabs, 1)
+            )
         
         # Active documents
         if STATE_SNAPSHOT_INCLUDE_DOCUMENTS:
@@ -208,5 +222,7 @@ class StateSnapshotter:
             if active_monitor:
                 lines.append(f"\nActive Monitor: {active_monitor}")
         
-        return "\n".join(lines) + "\n"
+        formatted = "\n".join(lines) + "\n"
+        self._formatted_cache = (cache_key, formatted)
+        return formatted
 
@@ -1,5 +1,6 @@
 """System context monitoring functions using AppleScript."""
 
+import re
 from typing import Dict, List, Optional, Tuple, Any
 from ..utils import AppleScriptExecutor
 from ..config import MONITORS
@@ -7,16 +8,40 @@ from ..config import MONITORS
 # Create a module-level executor instance
 _executor = AppleScriptExecutor()
 
+# Integers in AppleScript list output such as "{1440, 900}"
+_INT_RE = re.compile(r"-?\d+")
 
-def get_active_monitor() -> Optional[str]:
+# Monitor rectangles as (name, left, top, right, bottom), resolved once from config
+_MONITOR_BOUNDS: Tuple[Tuple[str, int, int, int, int], ...] = tuple(
+    (
+        name,
+        cfg.get("x", 0),
+        cfg.get("y", 0),
+        cfg.get("x", 0) + cfg.get("w", 1920),
+        cfg.get("y", 0) + cfg.get("h", 1080),
+    )
+    for name, cfg in MONITORS.items()
+)
+
+
+def _build_active_monitor_script() -> str:
     """
-    Get which monitor has the active window.
+    Build the AppleScript that returns the name of the monitor holding the front window.
+    
+    The monitor layout is fixed for the life of the process, so the rectangle
+    checks are generated once and run inside osascript instead of in Python.
     
     Returns:
-        Monitor name (e.g., "main", "left", "right") or None
+        AppleScript source
     """
-    try:
-        script = '''
+    check_lines = []
+    for name, left, top, right, bottom in _MONITOR_BOUNDS:
+        quoted_name = name.replace('"', '\\"')
+        check_lines.append(
+            f'                if x >= {left} and x < {right} and y >= {top} and y < {bottom} then return "{quoted_name}"'
+        )
+    checks = "\n".join(check_lines)
+    return f'''
         tell application "System Events"
             set frontApp to name of first application process whose frontmost is true
             if frontApp is not "" then
@@ -25,35 +50,33 @@ def get_active_monitor() -> Optional[str]:
                         set winPos to position of window 1
                         set x to item 1 of winPos
                         set y to item 2 of winPos
-                        return {x, y}
                     on error
-                        return {0, 0}
+                        set x to 0
+                        set y to 0
                     end try
                 end tell
+{checks}
             end if
         end tell
+        return ""
         '''
-        success, stdout, _ = _executor.execute(script)
+
+
+_ACTIVE_MONITOR_SCRIPT = _build_active_monitor_script()
+
+
+def get_active_monitor() -> Optional[str]:
+    """
+    Get which monitor has the active window.
+    
+    Returns:
+        Monitor name (e.g., "main", "left", "right") or None
+    """
+    try:
+        success, stdout, _ = _executor.execute(_ACTIVE_MONITOR_SCRIPT)
         if not success or not stdout:
             return None
-        
-        # Parse position
-        pos_str = stdout.replace("{", "").replace("}", "")
-        pos_parts = [int(p.strip()) for p in pos_str.split(",")]
-        if len(pos_parts) >= 2:
-            x, y = pos_parts[0], pos_parts[1]
-            
-            # Find which monitor contains this point
-            for monitor_name, monitor_config in MONITORS.items():
-                mx = monitor_config.get("x", 0)
-                my = monitor_config.get("y", 0)
-                mw = monitor_config.get("w", 1920)
-                mh = monitor_config.get("h", 1080)
-                
-                if mx <= x < mx + mw and my <= y < my + mh:
-                    return monitor_name
-        
-        return None
+        return stdout
     except Exception:
         return None
 
@@ -98,8 +121,7 @@ def get_screen_resolution() -> Tuple[int, int]:
         success, stdout, _ = _executor.execute(script)
         if success and stdout:
             # Parse: {width, height}
-            res_str = stdout.replace("{", "").replace("}", "")
-            res_parts = [int(p.strip()) for p in res_str.split(",")]
+            res_parts = [int(p) for p in _INT_RE.findall(stdout)]
             if len(res_parts) >= 2:
                 return tuple(res_parts[:2])
         
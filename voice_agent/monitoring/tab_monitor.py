@@ -4,7 +4,7 @@ import time
 from typing import List, Optional, Dict, Union, Tuple
 from urllib.parse import urlparse
 from ..utils import AppleScriptExecutor, escape_applescript_string
-from ..config import CACHE_TABS_TTL
+from ..config import CACHE_TABS_TTL, CACHE_APPS_TTL
 from ..cache import get_cache_manager
 
 # Create a module-level executor instance
@@ -14,6 +14,10 @@ _executor = AppleScriptExecutor()
 # Structure: {url: {"content": str, "title": str, "timestamp": float}}
 _tab_content_cache: Dict[str, Dict[str, Union[str, float]]] = {}
 
+# Last tab list enriched with content, keyed by the raw tab metadata it was built from
+# Structure: (raw_output, tabs with content_summary)
+_last_tabs_with_content: Optional[Tuple[str, List[Dict[str, Union[str, int, bool]]]]] = None
+
 
 def _extract_domain(url: str) -> str:
     """
@@ -33,20 +37,9 @@ def _extract_domain(url: str) -> str:
         return ''
 
 
-def list_chrome_tabs() -> tuple[List[Dict[str, Union[str, int, bool]]], Optional[str]]:
-    """
-    Get a list of all open Chrome tabs with rich metadata.
-    
-    Returns:
-        Tuple of (list of tab dicts, raw AppleScript output)
-        Tab dicts have: index, title, url, domain, window_index, 
-        local_index, is_active
-        Example: ([{"index": 1, "title": "Gmail - Inbox", "url": "https://mail.google.com", 
-                  "domain": "mail.google.com", "window_index": 1, "local_index": 1, "is_active": True}], raw_output)
-    """
-    try:
-        script = '''
-        tell application "Google Chrome"
+# AppleScript statements that collect Chrome tab metadata into tabData
+# (run inside a `tell application "Google Chrome"` block)
+_CHROME_TABS_SCRIPT = '''
             set tabData to ""
             set globalTabIndex to 1
             set windowIndex to 1
@@ -67,6 +60,79 @@ def list_chrome_tabs() -> tuple[List[Dict[str, Union[str, int, bool]]], Optional
                 end repeat
                 set windowIndex to windowIndex + 1
             end repeat
+'''
+
+# Separates the running apps section from the Chrome tabs section in the combined query
+_SECTION_DELIMITER = "=====TABS====="
+
+
+def _parse_chrome_tabs(output: str) -> List[Dict[str, Union[str, int, bool]]]:
+    """
+    Parse tab metadata lines produced by _CHROME_TABS_SCRIPT.
+    
+    Args:
+        output: One tab per line, formatted as globalIndex|||title|||url|||windowIndex|||localIndex|||isActive
+        
+    Returns:
+        List of tab dicts (see list_chrome_tabs)
+    """
+    tabs = []
+    lines = output.strip().split('\n')
+    
+    for line_num, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        
+        # Split by ||| delimiter
+        parts = line.split('|||')
+        
+        if len(parts) != 6:
+            continue
+        
+        try:
+            global_index = int(parts[0])
+            title = parts[1]
+            url = parts[2]
+            window_index = int(parts[3])
+            local_index = int(parts[4])
+            is_active = parts[5].lower() == "true"
+            
+            # Extract domain from URL
+            domain = _extract_domain(url)
+            
+            tabs.append({
+                "index": global_index,
+                "title": title,
+                "url": url,
+                "domain": domain,
+                "window_index": window_index,
+                "local_index": local_index,
+                "is_active": is_active
+            })
+            
+        except (ValueError, IndexError) as e:
+            print(f"Warning: Failed to parse tab {line_num}: {e}")
+            continue
+    
+    return tabs
+
+
+def list_chrome_tabs() -> tuple[List[Dict[str, Union[str, int, bool]]], Optional[str]]:
+    """
+    Get a list of all open Chrome tabs with rich metadata.
+    
+    Returns:
+        Tuple of (list of tab dicts, raw AppleScript output)
+        Tab dicts have: index, title, url, domain, window_index, 
+        local_index, is_active
+        Example: ([{"index": 1, "title": "Gmail - Inbox", "url": "https://mail.google.com", 
+                  "domain": "mail.google.com", "window_index": 1, "local_index": 1, "is_active": True}], raw_output)
+    """
+    try:
+        script = f'''
+        tell application "Google Chrome"
+{_CHROME_TABS_SCRIPT}
             return tabData
         end tell
         '''
@@ -77,49 +143,7 @@ def list_chrome_tabs() -> tuple[List[Dict[str, Union[str, int, bool]]], Optional
             return [], None
         
         raw_output = stdout if stdout else None
-        
-        # Parse the result
-        # AppleScript now returns one tab per line with ||| delimiter:
-        # Format: globalIndex|||title|||url|||windowIndex|||localIndex|||isActive
-        tabs = []
-        if stdout:
-            lines = stdout.strip().split('\n')
-            
-            for line_num, line in enumerate(lines, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Split by ||| delimiter
-                parts = line.split('|||')
-                
-                if len(parts) != 6:
-                    continue
-                
-                try:
-                    global_index = int(parts[0])
-                    title = parts[1]
-                    url = parts[2]
-                    window_index = int(parts[3])
-                    local_index = int(parts[4])
-                    is_active = parts[5].lower() == "true"
-                    
-                    # Extract domain from URL
-                    domain = _extract_domain(url)
-                    
-                    tabs.append({
-                        "index": global_index,
-                        "title": title,
-                        "url": url,
-                        "domain": domain,
-                        "window_index": window_index,
-                        "local_index": local_index,
-                        "is_active": is_active
-                    })
-                    
-                except (ValueError, IndexError) as e:
-                    print(f"Warning: Failed to parse tab {line_num}: {e}")
-                    continue
+        tabs = _parse_chrome_tabs(stdout) if stdout else []
         
         return tabs, raw_output
     except Exception as e:
@@ -127,6 +151,59 @@ def list_chrome_tabs() -> tuple[List[Dict[str, Union[str, int, bool]]], Optional
         return [], None
 
 
+def list_running_apps_and_chrome_tabs() -> Tuple[List[str], List[Dict[str, Union[str, int, bool]]], Optional[str]]:
+    """
+    Get running apps and Chrome tab metadata with a single osascript call.
+    
+    Saves one osascript process launch compared to calling list_running_apps and
+    list_chrome_tabs separately. Chrome is only queried if it is already running.
+    Caches the running apps list like list_running_apps.
+    
+    Returns:
+        Tuple of (running app names, list of tab dicts, raw tab AppleScript output)
+    """
+    try:
+        script = f'''
+        set appList to ""
+        tell application "System Events"
+            set processList to every process whose background only is false
+            repeat with proc in processList
+                if appList is not "" then
+                    set appList to appList & linefeed
+                end if
+                set appList to appList & name of proc
+            end repeat
+        end tell
+        set tabData to ""
+        if application "Google Chrome" is running then
+            tell application "Google Chrome"
+{_CHROME_TABS_SCRIPT}
+            end tell
+        end if
+        return appList & linefeed & "{_SECTION_DELIMITER}" & linefeed & tabData
+        '''
+        success, stdout, stderr = _executor.execute(script, check=True)
+        
+        if not success or not stdout or _SECTION_DELIMITER not in stdout:
+            print(f"Error listing running apps and Chrome tabs: {stderr}")
+            return [], [], None
+        
+        apps_output, tabs_output = stdout.split(_SECTION_DELIMITER, 1)
+        apps = [app.strip() for app in apps_output.strip().split('\n') if app.strip()]
+        tabs_output = tabs_output.strip()
+        raw_output = tabs_output if tabs_output else None
+        tabs = _parse_chrome_tabs(tabs_output) if tabs_output else []
+        
+        cache_manager = get_cache_manager()
+        if cache_manager:
+            cache_manager.set_apps("running", apps, ttl=CACHE_APPS_TTL)
+        
+        return apps, tabs, raw_output
+    except Exception as e:
+        print(f"Unexpected error listing running apps and Chrome tabs: {e}")
+        return [], [], None
+
+
 def get_active_chrome_tab() -> Optional[Dict[str, Union[str, int]]]:
     """
     Get the currently active Chrome tab info (more efficient than listing all tabs).
@@ -344,10 +421,17 @@ def get_tab_content_summary(tab_index: Optional[int] = None, tab_url: Optional[s
         return None
 
 
-def list_chrome_tabs_with_content() -> Tuple[List[Dict[str, Union[str, int, bool]]], Optional[str]]:
+def list_chrome_tabs_with_content(
+    tab_list: Optional[Tuple[List[Dict[str, Union[str, int, bool]]], Optional[str]]] = None
+) -> Tuple[List[Dict[str, Union[str, int, bool]]], Optional[str]]:
     """
     Get a list of all Chrome tabs with content summaries pre-loaded.
-    Uses cache if enabled.
+    Uses cache if enabled. Content is only re-read when the tab metadata (windows,
+    tabs, titles, URLs, active tab) changed since the last call.
+    
+    Args:
+        tab_list: Optional (tabs, raw_output) already fetched with list_chrome_tabs or
+            list_running_apps_and_chrome_tabs, to skip querying Chrome again
     
     Returns:
         Tuple of (list of tab dicts with 'content_summary' field added, raw AppleScript output)
@@ -362,7 +446,16 @@ def list_chrome_tabs_with_content() -> Tuple[List[Dict[str, Union[str, int, bool
     
     # Cache miss - fetch from Chrome
     # Get basic tab metadata and raw output
-    tabs, raw_output = list_chrome_tabs()
+    global _last_tabs_with_content
+    tabs, raw_output = tab_list if tab_list is not None else list_chrome_tabs()
+    
+    # Same windows and tabs as the last enriched list: reuse it without touching Chrome
+    if raw_output and _last_tabs_with_content is not None and _last_tabs_with_content[0] == raw_output:
+        tabs = _last_tabs_with_content[1]
+        if cache_manager:
+            cache_manager.set_tabs("tabs", tabs, ttl=CACHE_TABS_TTL)
+            cache_manager.set_tabs("tabs_raw", raw_output, ttl=CACHE_TABS_TTL)
+        return tabs, raw_output
     
     # Read content for each tab (with caching)
     for tab in tabs:
@@ -398,6 +491,8 @@ def list_chrome_tabs_with_content() -> Tuple[List[Dict[str, Union[str, int, bool
         time.sleep(0.1)
     
     # Cache the result
+    if raw_output:
+        _last_tabs_with_content = (raw_output, tabs)
     if cache_manager:
         cache_manager.set_tabs("tabs", tabs, ttl=CACHE_TABS_TTL)
         if raw_output:
@@ -408,8 +503,9 @@ def list_chrome_tabs_with_content() -> Tuple[List[Dict[str, Union[str, int, bool
 
 def clear_tab_cache() -> None:
     """Clear the tab content cache."""
-    global _tab_content_cache
+    global _tab_content_cache, _last_tabs_with_content
     _tab_content_cache.clear()
+    _last_tabs_with_content = None
 
 
 def get_cache_stats() -> Dict[str, int]:
@@ -1,11 +1,15 @@
 """Window monitoring functions using AppleScript."""
 
+import re
 from typing import List, Optional, Tuple, Dict, Any
 from ..utils import AppleScriptExecutor
 
 # Create a module-level executor instance
 _executor = AppleScriptExecutor()
 
+# Integers in AppleScript list output such as "{0, 25, 1440, 900}"
+_INT_RE = re.compile(r"-?\d+")
+
 
 def get_window_bounds(app_name: str) -> Optional[tuple[int, int, int, int]]:
     """
@@ -43,8 +47,7 @@ def get_window_bounds(app_name: str) -> Optional[tuple[int, int, int, int]]:
             return None
         
         # Parse bounds: {left, top, right, bottom}
-        bounds_str = stdout.replace("{", "").replace("}", "")
-        bounds_parts = [int(p.strip()) for p in bounds_str.split(",")]
+        bounds_parts = [int(p) for p in _INT_RE.findall(stdout)]
         if len(bounds_parts) == 4:
             return tuple(bounds_parts)
         return None
@@ -105,39 +108,112 @@ def get_all_windows(app_name: str) -> List[Dict[str, Any]]:
             return windows
         
         # Parse window data
-        lines = stdout.strip().split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            parts = line.split('|||')
-            if len(parts) >= 5:
-                try:
-                    index = int(parts[0])
-                    title = parts[1]
-                    bounds_str = parts[2]
-                    is_minimized = parts[3].lower() == "true"
-                    is_fullscreen = parts[4].lower() == "true"
-                    
-                    # Parse bounds
-                    bounds_parts = [int(p.strip()) for p in bounds_str.split(",")]
-                    if len(bounds_parts) == 4:
-                        bounds = tuple(bounds_parts)
-                    else:
-                        bounds = None
-                    
-                    windows.append({
-                        "index": index,
-                        "title": title,
-                        "bounds": bounds,
-                        "is_minimized": is_minimized,
-                        "is_fullscreen": is_fullscreen
-                    })
-                except (ValueError, IndexError):
-                    continue
+        for line in stdout.strip().split('\n'):
+            window = _parse_window_line(line)
+            if window:
+                windows.append(window)
         
         return windows
     except Exception:
         return []
 
+
+def _parse_window_line(line: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse one "index|||title|||l,t,r,b|||minimized|||fullscreen" line from AppleScript.
+    
+    Args:
+        line: Raw output line
+        
+    Returns:
+        Window dict, or None if the line is empty or malformed
+    """
+    parts = line.strip().split('|||')
+    if len(parts) < 5:
+        return None
+    try:
+        bounds_parts = [int(p.strip()) for p in parts[2].split(",")]
+        return {
+            "index": int(parts[0]),
+            "title": parts[1],
+            "bounds": tuple(bounds_parts) if len(bounds_parts) == 4 else None,
+            "is_minimized": parts[3].lower() == "true",
+            "is_fullscreen": parts[4].lower() == "true"
+        }
+    except (ValueError, IndexError):
+        return None
+
+
+# Prefix marking the start of a process's windows in list_apps_with_windows output
+_APP_MARKER = "@@@"
+
+
+def list_apps_with_windows() -> Tuple[Optional[str], List[Tuple[str, List[Dict[str, Any]]]]]:
+    """
+    Get the frontmost app and every running app's windows with a single osascript call.
+    
+    Replaces one list_running_apps call, one get_active_app call and a
+    get_all_windows call per app, which dominate the cost of a state snapshot.
+    
+    Returns:
+        Tuple of (frontmost app name or None, list of (app name, window dicts) in process order)
+    """
+    try:
+        script = f'''
+        tell application "System Events"
+            set output to ""
+            try
+                set output to name of first application process whose frontmost is true
+            end try
+            repeat with proc in (every process whose background only is false)
+                set output to output & linefeed & "{_APP_MARKER}" & (name of proc)
+                try
+                    set winIndex to 1
+                    repeat with w in windows of proc
+                        try
+                            set winTitle to title of w
+                            set winPos to position of w
+                            set winSize to size of w
+                            set isMin to minimized of w
+                            try
+                                set isFull to fullscreen of w
+                            on error
+                                set isFull to false
+                            end try
+                            
+                            set x1 to item 1 of winPos
+                            set y1 to item 2 of winPos
+                            set w1 to item 1 of winSize
+                            set h1 to item 2 of winSize
+                            
+                            set output to output & linefeed & (winIndex as text) & "|||" & winTitle & "|||" & (x1 as text) & "," & (y1 as text) & "," & ((x1 + w1) as text) & "," & ((y1 + h1) as text) & "|||" & (isMin as text) & "|||" & (isFull as text)
+                            set winIndex to winIndex + 1
+                        on error
+                            -- Skip windows we can't access
+                        end try
+                    end repeat
+                end try
+            end repeat
+            return output
+        end tell
+        '''
+        success, stdout, _ = _executor.execute(script)
+        if not success or not stdout:
+            return None, []
+        
+        active_app: Optional[str] = None
+        apps: List[Tuple[str, List[Dict[str, Any]]]] = []
+        for line in stdout.split('\n'):
+            if line.startswith(_APP_MARKER):
+                apps.append((line[len(_APP_MARKER):].strip(), []))
+            elif apps:
+                window = _parse_window_line(line)
+                if window:
+                    apps[-1][1].append(window)
+            elif line.strip():
+                # Frontmost app comes before the first marker (and is absent if the query failed)
+                active_app = line.strip()
+        
+        return active_app, apps
+    except Exception:
+        return None, []
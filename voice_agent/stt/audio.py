@@ -16,13 +16,41 @@ def calculate_audio_energy(audio_chunk: np.ndarray) -> float:
     Returns:
         Energy in dB
     """
-    # Use np.square instead of **2, slightly faster
-    rms = np.sqrt(np.mean(np.square(audio_chunk)))
+    # Dot product of the flattened view computes the sum of squares in a single
+    # BLAS pass without allocating a squared copy of the chunk
+    samples = audio_chunk.ravel()
+    if samples.size == 0:
+        return -200.0
+    rms = np.sqrt(np.dot(samples, samples) / samples.size)
     # Convert to dB, avoid log(0) by adding small epsilon
     db = 20 * np.log10(rms + 1e-10)
     return db
 
 
+def calculate_peak_energy(audio: np.ndarray, sample_rate: int, window_duration: float = 0.05) -> float:
+    """
+    Calculate the energy of the loudest window in a recording, in dB.
+    
+    Whole-buffer RMS is diluted by the silence around a short word, so a quiet
+    "yes" inside a long hold can fall below a threshold that the word itself clears.
+    
+    Args:
+        audio: Audio data as numpy array
+        sample_rate: Sample rate of the audio in Hz
+        window_duration: Window length in seconds (default: 50ms)
+        
+    Returns:
+        Energy in dB of the loudest window
+    """
+    samples = audio.ravel()
+    window = max(1, int(sample_rate * window_duration))
+    if samples.size <= window:
+        return calculate_audio_energy(samples)
+    # Trailing partial window is dropped; at most window_duration of audio is ignored
+    windows = samples[:samples.size - samples.size % window].reshape(-1, window)
+    mean_squares = np.einsum('ij,ij->i', windows, windows) / window
+    return 20 * np.log10(np.sqrt(mean_squares.max()) + 1e-10)
+
 def detect_speech_start(audio_chunk: np.ndarray, speech_threshold_db: float = -40.0) -> bool:
     """
     Detect if speech has started by checking if audio energy exceeds threshold.
@@ -21,13 +21,20 @@ class STTEngine(ABC):
         """
         pass
     
-    def transcribe_while_held(self, is_held: Callable[[], bool], context: Optional[str] = None) -> str:
+    def transcribe_while_held(
+        self,
+        is_held: Callable[[], bool],
+        context: Optional[str] = None,
+        on_partial: Optional[Callable[[str], None]] = None
+    ) -> str:
         """
         Record audio while a condition is true (e.g., while hotkey is held).
         
         Args:
             is_held: Callable that returns True while recording should continue
             context: Optional context text to help with transcription accuracy
+            on_partial: Optional callback receiving partial transcripts while recording
+                (engines without streaming support never call it)
         
         Returns:
             Transcribed text as a string
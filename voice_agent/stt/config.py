@@ -1,7 +1,7 @@
 """Configuration for STT engines."""
 
 # Re-export from main config for convenience
-from ..config import STT_ENGINE, WHISPER_MODEL, SILENCE_DURATION
+from ..config import STT_ENGINE, WHISPER_MODEL, SILENCE_DURATION, SPEECH_GATE_DB, STT_PARTIAL_INTERVAL
 
-__all__ = ["STT_ENGINE", "WHISPER_MODEL", "SILENCE_DURATION"]
+__all__ = ["STT_ENGINE", "WHISPER_MODEL", "SILENCE_DURATION", "SPEECH_GATE_DB", "STT_PARTIAL_INTERVAL"]
 
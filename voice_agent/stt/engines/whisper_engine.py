@@ -8,8 +8,8 @@ import time
 from typing import Optional, Callable
 
 from ..base import STTEngine
-from ..audio import detect_speech_start, detect_speech_end
-from ..config import WHISPER_MODEL, SILENCE_DURATION
+from ..audio import calculate_peak_energy, detect_speech_start, detect_speech_end
+from ..config import WHISPER_MODEL, SILENCE_DURATION, SPEECH_GATE_DB, STT_PARTIAL_INTERVAL
 
 # Import DecodingOptions for MLX Whisper (lazy import to avoid errors if not installed)
 try:
@@ -60,9 +60,21 @@ def preload_whisper_model(model_name: str = "base"):
     Args:
         model_name: Name of the Whisper model to preload (default: "base")
     """
-    # Just verify mlx-whisper is available and print confirmation
-    _get_mlx_whisper()
+    mlx_whisper = _get_mlx_whisper()
     model_path = _get_mlx_model_path(model_name)
+    
+    # Run one throwaway inference on silence so the weights are loaded and the GPU
+    # kernels compiled now, rather than on the first hotkey press
+    try:
+        decode_options = DecodingOptions(language="en")
+        mlx_whisper.transcribe(
+            np.zeros(16000, dtype=np.float32),
+            path_or_hf_repo=model_path,
+            **decode_options.__dict__
+        )
+    except Exception as e:
+        print(f"⚠️  Warning: Whisper warmup failed: {e}")
+    
     print(f"✅ MLX Whisper ready (model: '{model_name}' -> '{model_path}')")
 
 
@@ -242,21 +254,54 @@ class WhisperSTTEngine(STTEngine):
         
         return text
     
-    def transcribe_while_held(self, is_held: Callable[[], bool], context: Optional[str] = None) -> str:
+    def _transcribe_audio(self, audio: np.ndarray, context: Optional[str] = None) -> str:
+        """
+        Run MLX Whisper on a 1D audio buffer.
+        
+        Args:
+            audio: Audio samples at 16kHz
+            context: Optional context text to help with transcription accuracy
+        
+        Returns:
+            Transcribed text (stripped)
+        """
+        mlx_whisper = _get_mlx_whisper()
+        decode_options = DecodingOptions(language="en")
+        transcribe_kwargs = {
+            "path_or_hf_repo": _get_mlx_model_path(WHISPER_MODEL),
+            **decode_options.__dict__
+        }
+        if context:
+            # Limit context to ~224 tokens (Whisper's effective limit)
+            # Roughly 1 token = 4 characters, so ~900 characters max
+            if len(context) > 900:
+                context = context[:900]
+            transcribe_kwargs["initial_prompt"] = context
+        
+        result = mlx_whisper.transcribe(audio, **transcribe_kwargs)
+        return result["text"].strip()
+    
+    def transcribe_while_held(
+        self,
+        is_held: Callable[[], bool],
+        context: Optional[str] = None,
+        on_partial: Optional[Callable[[str], None]] = None
+    ) -> str:
         """
         Record audio while hotkey is held, then transcribe.
         
         Args:
             is_held: Callable that returns True while recording should continue
             context: Optional context text to help with transcription accuracy
+            on_partial: Optional callback receiving partial transcripts of the audio
+                recorded so far (every STT_PARTIAL_INTERVAL seconds, if enabled)
         
         Returns:
             Transcribed text as a string
         """
-        mlx_whisper = _get_mlx_whisper()
-        model_path = _get_mlx_model_path(WHISPER_MODEL)
+        _get_mlx_whisper()
         
-        print("\n🎤 Listening... (hold hotkey to speak)")
+        print("\n🎤 Listening... (hold hotkey to speak)", flush=True)
         
         # Ensure persistent stream is running
         self._start_persistent_stream()
@@ -275,12 +320,34 @@ class WhisperSTTEngine(STTEngine):
         audio_chunks = []
         min_recording_duration = 0.1  # Minimum 0.1s recording
         
+        # Partial transcription runs one pass at a time in a worker thread so
+        # recording is never blocked by Whisper
+        partials_enabled = on_partial is not None and STT_PARTIAL_INTERVAL > 0
+        partial_thread = None
+        next_partial_at = time.time() + STT_PARTIAL_INTERVAL
+        
+        def run_partial(audio_so_far):
+            try:
+                if calculate_peak_energy(audio_so_far, self._sample_rate) >= SPEECH_GATE_DB:
+                    partial_text = self._transcribe_audio(audio_so_far, context)
+                    if partial_text:
+                        on_partial(partial_text)
+            except Exception:
+                pass  # Partials are best-effort; the final pass reports errors
+        
         while is_held():
             # Collect chunks
             while not self._audio_queue.empty():
                 chunk = self._audio_queue.get()
                 audio_chunks.append(chunk)
             
+            if partials_enabled and audio_chunks and time.time() >= next_partial_at:
+                if partial_thread is None or not partial_thread.is_alive():
+                    audio_so_far = np.concatenate(audio_chunks, axis=0).flatten()
+                    partial_thread = threading.Thread(target=run_partial, args=(audio_so_far,), daemon=True)
+                    partial_thread.start()
+                    next_partial_at = time.time() + STT_PARTIAL_INTERVAL
+            
             time.sleep(0.02)  # Small delay to avoid busy waiting
         
         # Stop collecting (but keep stream running)
@@ -292,6 +359,10 @@ class WhisperSTTEngine(STTEngine):
             chunk = self._audio_queue.get()
             audio_chunks.append(chunk)
         
+        # Don't run the final pass concurrently with an in-flight partial on the GPU
+        if partial_thread is not None:
+            partial_thread.join()
+        
         if not audio_chunks:
             print("   (No audio recorded)")
             return ""
@@ -306,23 +377,16 @@ class WhisperSTTEngine(STTEngine):
         # Flatten to 1D array if needed (Whisper expects 1D array)
         if audio.ndim > 1:
             audio = audio.flatten()
+        
+        # Skip the Whisper pass entirely when the recording is silence (e.g., accidental tap)
+        if calculate_peak_energy(audio, self._sample_rate) < SPEECH_GATE_DB:
+            print("   (No speech detected)")
+            return ""
+        
         print("   Processing with Whisper (MLX GPU acceleration)...")
         
         # Transcribe with MLX Whisper
-        decode_options = DecodingOptions(language="en")
-        transcribe_kwargs = {
-            "path_or_hf_repo": model_path,
-            **decode_options.__dict__
-        }
-        if context:
-            # Limit context to ~224 tokens (Whisper's effective limit)
-            # Roughly 1 token = 4 characters, so ~900 characters max
-            if len(context) > 900:
-                context = context[:900]
-            transcribe_kwargs["initial_prompt"] = context
-        
-        result = mlx_whisper.transcribe(audio, **transcribe_kwargs)
-        text = result["text"].strip()
+        text = self._transcribe_audio(audio, context)
         
         if text:
             print(f"   Heard: '{text}'")
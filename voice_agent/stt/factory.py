@@ -78,17 +78,22 @@ def set_cached_engine(engine: STTEngine):
     _cached_engine = engine
 
 
-def transcribe_while_held(is_held, context: Optional[str] = None) -> str:
+def transcribe_while_held(
+    is_held,
+    context: Optional[str] = None,
+    on_partial: Optional[Callable[[str], None]] = None
+) -> str:
     """
     Record audio while a condition is true (e.g., while hotkey is held).
     
     Args:
         is_held: Callable that returns True while recording should continue
         context: Optional context text to help with transcription accuracy
+        on_partial: Optional callback receiving partial transcripts while recording
     
     Returns:
         Transcribed text as a string
     """
     engine = get_stt_engine()  # Use cached instance
-    return engine.transcribe_while_held(is_held, context=context)
+    return engine.transcribe_while_held(is_held, context=context, on_partial=on_partial)
 